@@ -19,7 +19,7 @@ def calc_sums(arr, frequenzy, aggregation="D", ts_index=0):
     df = pd.DataFrame(data=arr)
 
     if frequenzy == "s" or frequenzy == "m":
-        df["datetime"] = pd.to_datetime(df[0] / 1000, unit="s")  # unit=(D,s,ms,us,ns)
+        df["datetime"] = pd.to_datetime(df[0], unit="ms")  # unit=(D,s,ms,us,ns)
 
     resample = df.set_index("datetime")
     resample = resample.resample(aggregation).sum()
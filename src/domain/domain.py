@@ -23,18 +23,15 @@ def append_timezone_ts_to_df(df, ts_col, new_timezone, old_timezone="Africa/Accr
 
     # df = df.assign(ts_new = lambda x: (old_timezone.localize(x[ts_col]).astimezone(new_timezone)))
 
-    df["ts_c"] = pd.to_datetime(df[ts_col] / 1000, unit="s")
-
-    df.ts_c = df.ts_c.dt.tz_localize("UTC").dt.tz_convert(new_timezone)
+    # ms epochs parse directly as UTC (no float division, no separate tz_localize pass)
+    df["ts_c"] = pd.to_datetime(df[ts_col], unit="ms", utc=True).dt.tz_convert(new_timezone)
 
     return df
 
 
 def replace_ts_with_timezone_ts(df, ts_col, new_timezone, old_timezone="Africa/Accra"):
 
-    df[ts_col] = pd.to_datetime(df[ts_col] / 1000, unit="s")
-
-    df[ts_col] = df[ts_col].dt.tz_localize("UTC").dt.tz_convert(new_timezone)
+    df[ts_col] = pd.to_datetime(df[ts_col], unit="ms", utc=True).dt.tz_convert(new_timezone)
 
     return df
 
@@ -78,7 +75,7 @@ def aggregate_df_as_resample(
         [DataFrame]: [copied and changed dataframe]
     """
     if date_column == "":
-        df["datetime"] = pd.to_datetime(df["ts"] / 1000, unit="s")
+        df["datetime"] = pd.to_datetime(df["ts"], unit="ms")
         resample = df.set_index("datetime")
     else:
         resample = df.set_index(date_column)
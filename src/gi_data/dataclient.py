@@ -2,91 +2,165 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import functools
 import inspect
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union, Type, Iterable
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, Type, Iterable, TYPE_CHECKING
 from uuid import UUID
 
-import nest_asyncio
-import pandas as pd
-import atexit
-
 from gi_data.drivers.base import BaseDriver
-from gi_data.drivers.cloud_gql import CloudGQLDriver
-from gi_data.drivers.kafka_stream import KafkaStreamDriver
 from gi_data.drivers.local_http import HTTPTimeSeriesDriver
-from gi_data.drivers.ws_stream import WebSocketDriver
 from gi_data.infra.auth import AuthManager
 from gi_data.infra.http import AsyncHTTP
 from gi_data.mapping.enums import Resolution, DataType, DataFormat
 from gi_data.mapping.models import (GIStream, GIStreamVariable,
                                     GIOnlineVariable, VarSelector,
                                     CSVSettings, LogSettings,
-                                    CSVImportSettings, GIHistoryMeasurement)
+                                    CSVImportSettings, GIHistoryMeasurement,
+                                    GICatalog, var_selector)
 from gi_data.utils.logging import setup_module_logger
+from gi_data.utils.window_cache import WindowCache
+
+if TYPE_CHECKING:  # heavy / optional modules are imported where they are used
+    import numpy as np
+    import pandas as pd
 
-logger = setup_module_logger(__name__, level=logging.DEBUG)
+    from gi_data.drivers.kafka_stream import KafkaStreamDriver
+    from gi_data.drivers.ws_stream import WebSocketDriver
+    from gi_data.infra.http import Upload
+    from gi_data.utils.frames import FrameBackend
+
+logger = setup_module_logger(__name__)
 PACKAGE_PREFIX = "gi_data"
+# in-flight requests of fetch_*_many; matches the HTTP pool's connection limit
+FETCH_MANY_CONCURRENCY = 32
+# export_to_file write buffer: coalesces the 64 KiB download chunks into 1 MiB writes
+EXPORT_WRITE_BUFFER = 1 << 20
 # ------------------------------------------------------------------ #
 # helpers                                                            #
 # ------------------------------------------------------------------ #
 
 
+def _new_sync_loop() -> asyncio.AbstractEventLoop:
+    # aiokafka / websockets need a selector loop on Windows
+    if hasattr(asyncio, "WindowsSelectorEventLoopPolicy"):
+        return asyncio.WindowsSelectorEventLoopPolicy().new_event_loop()
+    try:  # optional (pip install pygidata[uvloop]); opt out with GI_UVLOOP=0
+        import uvloop
+    except ImportError:
+        uvloop = None
+    if uvloop is not None and os.getenv("GI_UVLOOP", "1") != "0":
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def _stop_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread) -> None:
+    if loop.is_closed():
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
 _SYNC_LOOP: asyncio.AbstractEventLoop | None = None
+_SYNC_LOOP_LOCK = threading.Lock()
+
 
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the process-wide loop that runs all synchronous client calls.
 
-def _get_or_create_sync_loop() -> asyncio.AbstractEventLoop:
+    Started on a daemon thread on first use and closed at interpreter exit.
+    """
     global _SYNC_LOOP
+    with _SYNC_LOOP_LOCK:
+        if _SYNC_LOOP is None or _SYNC_LOOP.is_closed():
+            loop = _new_sync_loop()
+            thread = threading.Thread(target=loop.run_forever, name="gi_data-loop", daemon=True)
+            thread.start()
+            atexit.register(_stop_loop, loop, thread)
+            _SYNC_LOOP = loop
+        return _SYNC_LOOP
+
+
+@functools.lru_cache(maxsize=None)
+def _driver_param_names(cls: Type) -> frozenset[str]:
+    """Names of the ctor-arguments accepted by ``cls`` (memoized per class)."""
+    return frozenset(inspect.signature(cls).parameters)
+
 
-    if _SYNC_LOOP is None or _SYNC_LOOP.is_closed():
-        if hasattr(asyncio, "WindowsSelectorEventLoopPolicy"):
-            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+def _driver_factory(driver_cls: Type, driver_kwargs: Dict[str, Any], auth: AuthManager, http: AsyncHTTP):
+    """Return ``build(domain)`` creating ``driver_cls`` with only the ctor-arguments it accepts."""
+    params = _driver_param_names(driver_cls)
+    # ctor-arguments the driver accepts, filtered once for every domain
+    accepted_kw = {k: v for k, v in {"client_id": None, **driver_kwargs}.items() if k in params}
 
-        _SYNC_LOOP = asyncio.new_event_loop()
-        asyncio.set_event_loop(_SYNC_LOOP)
+    def build(domain: str) -> BaseDriver:
+        kw = dict(accepted_kw)
+        # the domain goes to "domain" or "root" (HTTPTimeSeriesDriver), whichever the driver takes
+        for name in ("domain", "root"):
+            if name in params:
+                kw.setdefault(name, domain)
+        if "ws" in params:
+            kw.setdefault("ws", None)
+        return driver_cls(auth, http, **kw)
 
-    return _SYNC_LOOP
+    return build
 
 
-def _to_task(fut, as_task, loop):
-    if not as_task or isinstance(fut, asyncio.Task):
-        return fut
-    return loop.create_task(fut)
+async def _gather(aws: Iterable, limit: int = FETCH_MANY_CONCURRENCY):
+    sem = asyncio.Semaphore(limit)
 
+    async def one(aw):
+        async with sem:
+            return await aw
 
-def _run(fut, as_task: bool = True):
+    return await asyncio.gather(*(one(aw) for aw in aws))
+
+
+def _concat_columns(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    import pandas as pd
+
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    out = pd.concat(frames, axis=1)
+    # the union of sorted indexes is sorted already; only sort when it is not
+    return out if out.index.is_monotonic_increasing else out.sort_index()
+
+
+def _run(fut, loop: asyncio.AbstractEventLoop):
     """
     Run an awaitable from synchronous code.
 
     - If we're already inside a running loop (e.g. Jupyter), use nest_asyncio and run on it.
-    - Otherwise, reuse a single dedicated sync loop for the whole process.
+    - Otherwise, submit it to ``loop`` (the client's background loop) and block on the result.
     """
     try:
-        loop = asyncio.get_running_loop()
+        running = asyncio.get_running_loop()
     except RuntimeError:
-        loop = _get_or_create_sync_loop()
-        return loop.run_until_complete(_to_task(fut, as_task, loop))
+        return asyncio.run_coroutine_threadsafe(fut, loop).result()
     else:
-        nest_asyncio.apply(loop)
-        return loop.run_until_complete(_to_task(fut, as_task, loop))
+        import nest_asyncio
 
-
-def _close_sync_loop() -> None:
-    global _SYNC_LOOP
-    if _SYNC_LOOP is not None and not _SYNC_LOOP.is_closed():
-        try:
-            _SYNC_LOOP.stop()
-        finally:
-            _SYNC_LOOP.close()
-    _SYNC_LOOP = None
-
-
-atexit.register(_close_sync_loop)
+        nest_asyncio.apply(running)
+        return running.run_until_complete(fut)
 
 
 class GIDataClient:
     """
     High-level synchronous interface for GI Data-API.
+
+    Code that already runs an event loop should use the ``a*`` coroutines
+    (``afetch_buffer``, ``aread_online``, ...), which await the drivers directly.
+    Use either the sync or the async methods on one client: the HTTP pool is
+    bound to the loop that opened its connections.
     """
 
     def __init__(
@@ -99,58 +173,125 @@ class GIDataClient:
             driver_cls: Type = HTTPTimeSeriesDriver,
             driver_kwargs: Optional[dict] = None,
     ) -> None:
+        # one persistent loop (shared by all clients) keeps the httpx pool alive across calls
+        self._loop = _get_sync_loop()
+        self._closed = False
+
         self._kafka = None
         self._auth = AuthManager(base_url, username, password, access_token=access_token)
         self._http = AsyncHTTP(base_url, self._auth)
 
-        driver_kwargs = driver_kwargs or {}
-
-        # ------------------------------------------------------------------
-        # driver factory that only passes supported ctor-arguments
-        # ------------------------------------------------------------------
-        def _build_driver(domain: str):
-            sig = inspect.signature(driver_cls)  # ctor signature
-            kw: Dict[str, Any] = {"client_id": None, **driver_kwargs}
-
-            # only add "domain" if the driver accepts it
-            if "domain" in sig.parameters:
-                kw["domain"] = domain
+        # domain drivers: GI.cloud always uses the GraphQL driver, otherwise ``driver_cls``
+        if self._auth.is_cloud_environment():
+            from gi_data.drivers.cloud_gql import CloudGQLDriver
 
-            kw = {k: v for k, v in kw.items() if k in sig.parameters}
-            return driver_cls(self._auth, self._http, **kw)
-
-        # domain drivers
-        cloud_env = self._auth.is_cloud_environment()
-
-        buffer_driver = CloudGQLDriver(self._auth, self._http) if cloud_env \
-            else HTTPTimeSeriesDriver(self._auth, self._http, None, "buffer")
-
-        history_driver = CloudGQLDriver(self._auth, self._http) if cloud_env \
-            else HTTPTimeSeriesDriver(self._auth, self._http, None, "history")
+            buffer_driver = CloudGQLDriver(self._auth, self._http)
+            history_driver = CloudGQLDriver(self._auth, self._http)
+        else:
+            build = _driver_factory(driver_cls, driver_kwargs or {}, self._auth, self._http)
+            buffer_driver = build("buffer")
+            history_driver = build("history")
 
         self._drivers: Dict[str, BaseDriver] = {
             "buffer": buffer_driver,  # ← cloud => GQL Raw
             "history": history_driver,
         }
 
+        # bound driver coroutines for the per-call hot paths (no dict / attribute lookups per call)
+        self._read = buffer_driver.read
+        self._write = buffer_driver.write
+        self._read_values = buffer_driver.read_values
+        self._read_array = buffer_driver.read_array
+        self._write_values = buffer_driver.write_values
+        self._fetch_buffer = buffer_driver.fetch_buffer
+        self._fetch_history = history_driver.fetch_history
+
         self._ws_driver: Optional[WebSocketDriver] = None
+        self._catalog: Optional[GICatalog] = None
+        self._catalog_expires = 0.0
+        self._window_cache = WindowCache()
+
+    def _run(self, fut):
+        return _run(fut, self._loop)
+
+    # --------------------------- catalog ----------------------------- #
+    def prefetch_catalog(self, ttl_s: float = 60.0) -> GICatalog:
+        """
+        Load online variables, buffer sources and all their variables at once.
+
+        The snapshot is served by ``list_variables``, ``list_buffer_sources`` and
+        ``list_buffer_variables`` for ``ttl_s`` seconds.
+        """
+        catalog = self._run(self._drivers["buffer"].catalog())
+        self._catalog = catalog
+        self._catalog_expires = time.monotonic() + ttl_s
+        return catalog
+
+    def _cached_catalog(self) -> Optional[GICatalog]:
+        if self._catalog is not None and time.monotonic() < self._catalog_expires:
+            return self._catalog
+        return None
 
     # --------------------------- online ------------------------------ #
     def list_variables(self) -> List[GIOnlineVariable]:
-        return _run(self._drivers["buffer"].list_variables())
+        catalog = self._cached_catalog()
+        if catalog is not None:
+            return list(catalog.online_variables)
+        return self._run(self._drivers["buffer"].list_variables())
 
     def read_online(self, var_ids: List[UUID]) -> Dict[UUID, float]:
-        return _run(self._drivers["buffer"].read(var_ids))
+        return self._run(self._read(var_ids))
 
     def write_online(self, mapping: Dict[UUID, float]) -> None:
-        _run(self._drivers["buffer"].write(mapping))
+        self._run(self._write(mapping))
+
+    def read_online_values(self, var_ids: Sequence[Union[UUID, str]]) -> np.ndarray:
+        """Like ``read_online`` but returns a float64 array in request order instead of a dict."""
+        return self._run(self._read_array(var_ids))
+
+    def read_online_arrays(self, var_ids: np.ndarray) -> np.ndarray:
+        """
+        Read online values for an ``(N, 16)`` uint8 array of raw UUID bytes.
+
+        Array counterpart of ``read_online`` for high-rate polling: no ``UUID``
+        objects or dicts are built. Returns a float64 array in request order
+        (``NaN`` for missing values). See ``gi_data.utils.uuids.uuid_array``.
+        """
+        import numpy as np
+        from gi_data.utils.uuids import uuid_strings
+
+        vals = self._run(self._read_values(uuid_strings(var_ids)))
+        return np.asarray(vals, dtype=np.float64)
+
+    def write_online_arrays(self, var_ids: np.ndarray, values: np.ndarray) -> None:
+        """Write ``values`` to the variables in an ``(N, 16)`` uint8 UUID-bytes array."""
+        import numpy as np
+        from gi_data.utils.uuids import uuid_strings
+
+        vals = np.asarray(values, dtype=np.float64).tolist()
+        self._run(self._write_values(uuid_strings(var_ids), vals))
 
     # --------------------------- buffer ------------------------------ #
+    @staticmethod
+    def selector(
+            source_id: Union[UUID, str, int] | None,
+            var_id: Union[UUID, str],
+            selector: str = "latest",
+    ) -> VarSelector:
+        """Return a cached ``VarSelector``; polling loops get the same instance each time."""
+        return var_selector(source_id, var_id, selector)
+
     def list_buffer_sources(self) -> List[GIStream]:
-        return _run(self._drivers["buffer"].list_buffer_sources())
+        catalog = self._cached_catalog()
+        if catalog is not None:
+            return list(catalog.sources)
+        return self._run(self._drivers["buffer"].list_buffer_sources())
 
     def list_buffer_variables(self, source_id: Union[UUID, int]) -> List[GIStreamVariable]:
-        return _run(self._drivers["buffer"].list_buffer_variables(source_id))
+        catalog = self._cached_catalog()
+        if catalog is not None and str(source_id) in catalog.variables:
+            return list(catalog.variables[str(source_id)])
+        return self._run(self._drivers["buffer"].list_buffer_variables(source_id))
 
     def fetch_buffer(
             self,
@@ -159,20 +300,29 @@ class GIDataClient:
             start_ms: float = -20_000,
             end_ms: float = 0,
             points: int = 2048,
+            backend: FrameBackend = "pandas",
+            cache: bool = False,
     ) -> pd.DataFrame:
-        return _run(
-            self._drivers["buffer"].fetch_buffer(
-                selectors, start_ms=start_ms, end_ms=end_ms, points=points
-            )
-        )
+        """
+        Fetch buffer data for ``selectors``.
+
+        With ``cache`` set, absolute windows in the past are loaded as a wider
+        chunk and later overlapping windows are sliced from memory.
+        """
+        df = self._run(self._buffer_call(selectors, start_ms, end_ms, points, cache))
+        if backend == "pandas":
+            return df
+        from gi_data.utils.frames import convert_frame
+
+        return convert_frame(df, backend)
 
     # --------------------------- history ----------------------------- #
 
     def list_history_sources(self) -> List[GIStream]:
-        return _run(self._drivers["history"].list_buffer_sources())
+        return self._run(self._drivers["history"].list_buffer_sources())
 
     def list_history_variables(self, source_id: Union[UUID, int]):
-        return _run(self._drivers["history"].list_buffer_variables(source_id))
+        return self._run(self._drivers["history"].list_buffer_variables(source_id))
 
     def list_history_measurements(
             self,
@@ -188,7 +338,7 @@ class GIDataClient:
             meas_metadata_filter: Optional[List[dict]] = None,
     ) -> List[GIHistoryMeasurement]:
 
-        result = _run(
+        result = self._run(
             self._drivers["history"].list_measurements(
                 source_id,
                 start=start,
@@ -213,17 +363,95 @@ class GIDataClient:
             start_ms: float = 0,
             end_ms: float = 0,
             points: int = 2048,
+            backend: FrameBackend = "pandas",
+            cache: bool = False,
     ) -> pd.DataFrame:
-        return _run(
-            self._drivers["history"].fetch_history(
-                selectors,
-                measurement_id=measurement_id,
-                start_ms=start_ms,
-                end_ms=end_ms,
-                points=points,
+        """Fetch measurement data; ``cache`` works as for ``fetch_buffer``."""
+        df = self._run(self._history_call(selectors, measurement_id, start_ms, end_ms, points, cache))
+        if backend == "pandas":
+            return df
+        from gi_data.utils.frames import convert_frame
+
+        return convert_frame(df, backend)
+
+    def _buffer_call(self, selectors, start_ms, end_ms, points, cache):
+        if cache and WindowCache.cacheable(start_ms, end_ms):
+            return self._window_cache.fetch(
+                ("buffer", tuple(selectors)),
+                functools.partial(self._fetch_buffer, selectors),
+                start_ms=start_ms, end_ms=end_ms, points=points,
+            )
+        return self._fetch_buffer(selectors, start_ms=start_ms, end_ms=end_ms, points=points)
+
+    def _history_call(self, selectors, measurement_id, start_ms, end_ms, points, cache):
+        if cache and WindowCache.cacheable(start_ms, end_ms):
+            return self._window_cache.fetch(
+                ("history", str(measurement_id), tuple(selectors)),
+                functools.partial(self._fetch_history, selectors, measurement_id=measurement_id),
+                start_ms=start_ms, end_ms=end_ms, points=points,
             )
+        return self._fetch_history(
+            selectors, measurement_id=measurement_id, start_ms=start_ms, end_ms=end_ms, points=points
         )
 
+    def fetch_buffer_many(
+            self,
+            requests: List[Dict[str, Any]],
+            *,
+            concat: bool = False,
+    ) -> Union[List[pd.DataFrame], pd.DataFrame]:
+        """
+        Run several ``fetch_buffer`` calls concurrently.
+
+        Each request is a dict of ``fetch_buffer`` arguments (``selectors`` plus
+        optional ``start_ms``, ``end_ms``, ``points``). Returns the frames in
+        request order, or one column-wise joined frame if ``concat`` is set.
+        At most ``FETCH_MANY_CONCURRENCY`` requests are in flight at once.
+        """
+        frames = self._run(_gather(self._buffer_many(requests)))
+        return _concat_columns(frames) if concat else frames
+
+    def fetch_history_many(
+            self,
+            requests: List[Dict[str, Any]],
+            *,
+            concat: bool = False,
+    ) -> Union[List[pd.DataFrame], pd.DataFrame]:
+        """
+        Run several ``fetch_history`` calls concurrently.
+
+        Each request is a dict of ``fetch_history`` arguments (``selectors``,
+        ``measurement_id`` plus optional ``start_ms``, ``end_ms``, ``points``).
+        Returns the frames in request order, or one joined frame if ``concat`` is set.
+        """
+        frames = self._run(_gather(self._history_many(requests)))
+        return _concat_columns(frames) if concat else frames
+
+    def _buffer_many(self, requests: List[Dict[str, Any]]):
+        drv = self._drivers["buffer"]
+        return [
+            drv.fetch_buffer(
+                r["selectors"],
+                start_ms=r.get("start_ms", -20_000),
+                end_ms=r.get("end_ms", 0),
+                points=r.get("points", 2048),
+            )
+            for r in requests
+        ]
+
+    def _history_many(self, requests: List[Dict[str, Any]]):
+        drv = self._drivers["history"]
+        return [
+            drv.fetch_history(
+                r["selectors"],
+                measurement_id=r["measurement_id"],
+                start_ms=r.get("start_ms", 0),
+                end_ms=r.get("end_ms", 0),
+                points=r.get("points", 2048),
+            )
+            for r in requests
+        ]
+
     # -------------------------- websocket ---------------------------- #
     async def stream_online(
             self,
@@ -253,8 +481,25 @@ class GIDataClient:
         driver = await self._ensure_ws_driver()
         await driver.publish(data, function=function)
 
+    async def publish_batch(
+            self,
+            data: Dict[UUID, float] | List[Tuple[UUID, float]],
+            *,
+            function: str = "write",
+            flush_ms: float = 5.0,
+    ) -> None:
+        """Coalesce publishes issued within ``flush_ms`` into one WebSocket frame."""
+        driver = await self._ensure_ws_driver()
+        await driver.publish_batch(data, function=function, flush_ms=flush_ms)
+
+    async def flush_publish(self) -> None:
+        """Send values queued by ``publish_batch`` immediately."""
+        if self._ws_driver is not None:
+            await self._ws_driver.flush()
+
     async def _ensure_ws_driver(self) -> WebSocketDriver:
         if self._ws_driver is None:
+            from gi_data.drivers.ws_stream import WebSocketDriver
             from gi_data.infra.ws import AsyncWS
             ws = AsyncWS(self._http.base_url, self._auth)
             self._ws_driver = WebSocketDriver(self._auth, ws, self._http)
@@ -269,11 +514,32 @@ class GIDataClient:
             group_id: str = "gi_data_client",
     ):
         driver = await self._ensure_kafka_driver()
-        logger.debug(f"Kafka driver: {driver}")
+        logger.debug("Kafka driver: %s", driver)
+        received = 0
         async for update in driver.stream(var_ids, ssl=ssl, group_id=group_id):
-            logger.debug("Kafka update: %s", update)
+            received += 1
+            if received % 10_000 == 0:  # periodic counter instead of a log line per message
+                logger.debug("Kafka updates received: %d", received)
             yield update
 
+    async def stream_kafka_batches(
+            self,
+            var_ids: List[UUID],
+            *,
+            ssl: bool = False,
+            group_id: str = "gi_data_client",
+            batch_size: int = 500,
+            linger_ms: int = 50,
+    ):
+        """Like ``stream_kafka`` but yields lists of up to ``batch_size`` updates per poll."""
+        driver = await self._ensure_kafka_driver()
+        async for batch in driver.stream_batches(
+                var_ids, ssl=ssl, group_id=group_id, batch_size=batch_size, linger_ms=linger_ms
+        ):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Kafka batch: %d updates", len(batch))
+            yield batch
+
     async def _ensure_kafka_driver(self) -> KafkaStreamDriver:
         if self._kafka is None:
             from gi_data.drivers.kafka_stream import KafkaStreamDriver
@@ -299,13 +565,22 @@ class GIDataClient:
             csv_settings: Optional[CSVSettings] = None,
             log_settings: Optional[LogSettings] = None,
             target: Optional[str] = None,
-    ) -> bytes:
+            sink: Optional[Callable[[bytes], Any]] = None,
+    ) -> bytearray:
+        """
+        Export data in the given file format.
+
+        The response is collected chunk-wise into one ``bytearray``. Pass ``sink``
+        (e.g. ``fh.write``) to receive the chunks directly instead; the returned
+        buffer is then empty.
+        """
         drv = self._drivers["buffer"]
+        out = bytearray()
 
         if format.value not in drv.supported_exports():
             raise NotImplementedError(f"{drv.name} does not support {format.value}")
 
-        return _run(
+        self._run(
             drv.export(
                 selectors,
                 start_ms=start_ms,
@@ -322,22 +597,30 @@ class GIDataClient:
                 csv_settings=csv_settings,
                 log_settings=log_settings,
                 target=target,
+                sink=sink or out.extend,
             )
         )
+        return out
 
     # convenience
-    def export_csv(self, selectors, *, start_ms, end_ms, **kw) -> bytes:
+    def export_csv(self, selectors, *, start_ms, end_ms, **kw) -> bytearray:
         return self.export_data(selectors, start_ms=start_ms, end_ms=end_ms, format=DataFormat.CSV, **kw)
 
-    def export_udbf(self, selectors, *, start_ms, end_ms, **kw) -> bytes:
+    def export_udbf(self, selectors, *, start_ms, end_ms, **kw) -> bytearray:
         return self.export_data(selectors, start_ms=start_ms, end_ms=end_ms, format=DataFormat.UDBF, **kw)
 
+    def export_to_file(self, path: str, selectors, *, start_ms, end_ms, format: DataFormat, **kw) -> str:
+        """Export straight to ``path`` without holding the payload in memory."""
+        with open(path, "wb", buffering=EXPORT_WRITE_BUFFER) as fh:
+            self.export_data(selectors, start_ms=start_ms, end_ms=end_ms, format=format, sink=fh.write, **kw)
+        return path
+
     # --------------------------- import ------------------------------- #
     def import_data(
             self,
             source_id: str,
             source_name: str,
-            file_bytes: bytes,
+            file_bytes: Upload,
             *,
             format: DataFormat,
             target: str = "stream",  # "stream" | "record" - only stream on cloud
@@ -353,7 +636,7 @@ class GIDataClient:
         drv = self._drivers["history"]
 
         if format == DataFormat.CSV:
-            return _run(
+            return self._run(
                 drv.import_csv(
                     source_id,
                     source_name,
@@ -370,7 +653,7 @@ class GIDataClient:
             )
 
         if format == DataFormat.UDBF:
-            return _run(
+            return self._run(
                 drv.import_udbf(
                     source_id,
                     source_name,
@@ -386,15 +669,119 @@ class GIDataClient:
 
         raise NotImplementedError(f"Import for format={format} not supported.")
 
+    def import_file(self, path: str, source_id: str, source_name: str, *, format: DataFormat, **kw) -> str:
+        """Import the file at ``path``; its content is streamed, not read into memory."""
+        with open(path, "rb") as fh:
+            return self.import_data(source_id, source_name, fh, format=format, **kw)
+
     def import_csv(self, source_id, source_name, file_bytes, **kw) -> str:
         return self.import_data(source_id, source_name, file_bytes, format=DataFormat.CSV, **kw)
 
     def import_udbf(self, source_id, source_name, file_bytes, **kw) -> str:
         return self.import_data(source_id, source_name, file_bytes, format=DataFormat.UDBF, **kw)
 
+    # -------------------------- async API ---------------------------- #
+    async def alist_variables(self) -> List[GIOnlineVariable]:
+        catalog = self._cached_catalog()
+        if catalog is not None:
+            return list(catalog.online_variables)
+        return await self._drivers["buffer"].list_variables()
+
+    async def aread_online(self, var_ids: List[UUID]) -> Dict[UUID, float]:
+        return await self._read(var_ids)
+
+    async def aread_online_values(self, var_ids: Sequence[Union[UUID, str]]) -> np.ndarray:
+        return await self._read_array(var_ids)
+
+    async def awrite_online(self, mapping: Dict[UUID, float]) -> None:
+        await self._write(mapping)
+
+    async def alist_buffer_sources(self) -> List[GIStream]:
+        catalog = self._cached_catalog()
+        if catalog is not None:
+            return list(catalog.sources)
+        return await self._drivers["buffer"].list_buffer_sources()
+
+    async def alist_buffer_variables(self, source_id: Union[UUID, int]) -> List[GIStreamVariable]:
+        catalog = self._cached_catalog()
+        if catalog is not None and str(source_id) in catalog.variables:
+            return list(catalog.variables[str(source_id)])
+        return await self._drivers["buffer"].list_buffer_variables(source_id)
+
+    async def afetch_buffer(
+            self,
+            selectors: List[VarSelector],
+            *,
+            start_ms: float = -20_000,
+            end_ms: float = 0,
+            points: int = 2048,
+            cache: bool = False,
+    ) -> pd.DataFrame:
+        return await self._buffer_call(selectors, start_ms, end_ms, points, cache)
+
+    async def alist_history_sources(self) -> List[GIStream]:
+        return await self._drivers["history"].list_buffer_sources()
+
+    async def alist_history_variables(self, source_id: Union[UUID, int]) -> List[GIStreamVariable]:
+        return await self._drivers["history"].list_buffer_variables(source_id)
+
+    async def afetch_history(
+            self,
+            selectors: List[VarSelector],
+            measurement_id: UUID,
+            *,
+            start_ms: float = 0,
+            end_ms: float = 0,
+            points: int = 2048,
+            cache: bool = False,
+    ) -> pd.DataFrame:
+        return await self._history_call(selectors, measurement_id, start_ms, end_ms, points, cache)
+
+    async def afetch_buffer_many(
+            self,
+            requests: List[Dict[str, Any]],
+            *,
+            concat: bool = False,
+    ) -> Union[List[pd.DataFrame], pd.DataFrame]:
+        frames = await _gather(self._buffer_many(requests))
+        return _concat_columns(frames) if concat else frames
+
+    async def afetch_history_many(
+            self,
+            requests: List[Dict[str, Any]],
+            *,
+            concat: bool = False,
+    ) -> Union[List[pd.DataFrame], pd.DataFrame]:
+        frames = await _gather(self._history_many(requests))
+        return _concat_columns(frames) if concat else frames
+
+    async def aclose(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        await self._release()
+
+    async def _release(self) -> None:
+        # the WS driver flushes pending publish_batch values before its socket closes
+        try:
+            if self._ws_driver is not None:
+                await self._ws_driver.close()
+        finally:
+            await self._http.aclose()
+
+    async def __aenter__(self) -> "GIDataClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        await self.aclose()
+        return False
+
     # ------------------------ housekeeping --------------------------- #
     def close(self) -> None:
-        _run(self._http.aclose())
+        if self._closed or self._loop.is_closed():
+            return
+        self._closed = True
+        self._run(self._release())
 
     def __enter__(self) -> "GIDataClient":
         return self
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import abc
-from typing import AsyncIterator, Dict, List, Literal, Optional
+import asyncio
+from typing import Any, AsyncIterator, Callable, Dict, List, Literal, Optional, Sequence, TYPE_CHECKING
 from uuid import UUID
 
-import pandas as pd
+from gi_data.mapping.models import LogSettings, CSVSettings, VarSelector, GICatalog
 
-from gi_data.mapping.models import LogSettings, CSVSettings, VarSelector
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+    from gi_data.mapping.enums import Resolution
 
 
 class BaseDriver(abc.ABC):
@@ -39,6 +44,27 @@ class BaseDriver(abc.ABC):
         """Write values to online variables."""
         raise NotImplementedError
 
+    async def read_values(self, var_ids: Sequence[str]) -> List[float | None]:
+        """Read current online values for UUID strings, in request order."""
+        raise NotImplementedError
+
+    async def write_values(self, var_ids: Sequence[str], values: Sequence[float]) -> None:
+        """Write values to online variables given as UUID strings."""
+        raise NotImplementedError
+
+    async def read_array(self, var_ids: Sequence[UUID | str]) -> np.ndarray:
+        """Online values as one float64 array in request order (``NaN`` for missing values)."""
+        import numpy as np
+        from gi_data.utils.uuids import uuid_str
+
+        ids = [uuid_str(v) for v in var_ids]
+        out = np.full(len(ids), np.nan)
+        vals = np.asarray(await self.read_values(ids), dtype=np.float64)
+        # a response without data yields fewer (or no) values: keep NaN for the rest
+        n = min(len(vals), len(ids))
+        out[:n] = vals[:n]
+        return out
+
     # ----------------------------  BUFFER  --------------------------------
 
     async def list_buffer_sources(self) -> List["Source"]:  # noqa: F821
@@ -53,6 +79,16 @@ class BaseDriver(abc.ABC):
         """Fetch equidistant or absolute buffer data."""
         raise NotImplementedError
 
+    async def catalog(self) -> GICatalog:
+        """Return online variables, buffer sources and their variables (requests run concurrently)."""
+        online, sources = await asyncio.gather(self.list_variables(), self.list_buffer_sources())
+        per_source = await asyncio.gather(*(self.list_buffer_variables(s.id) for s in sources))
+        return GICatalog(
+            online_variables=online,
+            sources=sources,
+            variables={str(s.id): v for s, v in zip(sources, per_source)},
+        )
+
     # ---------------------------  HISTORY  --------------------------------
 
     async def list_measurements(self, *args, **kwargs) -> List["Measurement"]:  # noqa: F821
@@ -76,7 +112,7 @@ class BaseDriver(abc.ABC):
         """
         raise NotImplementedError
 
-    async def export_data(
+    async def export(
             self,
             selectors: List["VarSelector"],
             *,
@@ -85,6 +121,8 @@ class BaseDriver(abc.ABC):
             format: Literal["csv", "udbf"],
             points: Optional[int] = None,
             timezone: str = "UTC",
+            resolution: Optional["Resolution"] = None,
+            data_type: Optional[str] = None,
             aggregation: Optional[str] = None,
             date_format: Optional[str] = None,
             filename: Optional[str] = None,
@@ -92,23 +130,22 @@ class BaseDriver(abc.ABC):
             csv_settings: Optional["CSVSettings"] = None,
             log_settings: Optional["LogSettings"] = None,
             target: Optional[str] = None,
+            sink: Optional[Callable[[bytes], Any]] = None,
     ) -> bytes:
+        """Export data as file content (called by ``GIDataClient.export_data``)."""
         raise NotImplementedError
 
     def supported_exports(self) -> set[str]:
         return {"csv", "udbf"}
 
-    def import_csv(self, source_id, source_name, file_bytes, target,
-                   csv_settings, add_time_series, retention_time_sec,
-                   time_offset_sec, sample_rate, auto_create_metadata, session_timeout_sec):
-        pass
-
-    def import_udbf(self, source_id, source_name, file_bytes,
-                    target, add_time_series, sample_rate,
-                    auto_create_metadata, session_timeout_sec, **kwargs):
-        pass
+    async def import_csv(self, source_id, source_name, file_bytes, *, target,
+                         csv_settings, add_time_series, retention_time_sec,
+                         time_offset_sec, sample_rate, auto_create_metadata, session_timeout_sec) -> str:
+        """Import CSV file content; returns the import session id."""
+        raise NotImplementedError
 
-    def export(self, selectors, start_ms, end_ms, format, points,
-               timezone, resolution, data_type, aggregation,
-               date_format, filename, precision, csv_settings, log_settings, target):
-        pass
+    async def import_udbf(self, source_id, source_name, file_bytes, *,
+                          target, add_time_series, sample_rate,
+                          auto_create_metadata, session_timeout_sec, **kwargs) -> str:
+        """Import UDBF file content; returns the import session id."""
+        raise NotImplementedError
@@ -1,23 +1,65 @@
 from __future__ import annotations
+import asyncio
+import functools
 import math
 import logging
+import sys
+import time
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Sequence, Union, Optional, Literal, Iterable
+from typing import (
+    Any, Awaitable, Callable, Dict, Iterable, List, Literal, Optional, Sequence, Tuple, TypeVar, Union, TYPE_CHECKING,
+)
 from uuid import UUID
 
-import pandas as pd
-
 from gi_data.mapping.enums import Resolution, DataType
 from gi_data.mapping.models import (
-    GIStream, GIStreamVariable, TimeSeries, VarSelector, BufferRequest, LogSettings, CSVSettings,
-    CSVImportSettings, GIHistoryMeasurement, GIOnlineVariable, CSVImportSettingsDefaultCloud
+    GIStream, GIStreamVariable, VarSelector, BufferRequest, LogSettings, CSVSettings,
+    CSVImportSettings, GIHistoryMeasurement, GIOnlineVariable, CSVImportSettingsDefaultCloud, GICatalog,
+    model_from_raw,
+    parse_data_list,
+    request_body,
+    settings_dump,
+    unique_selectors,
 )
+from gi_data.mapping.cache import load_var_mapping, save_var_mapping
+from gi_data.utils.uuids import uuid_str
 from .base import BaseDriver
 from ..utils.logging import setup_module_logger
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from gi_data.infra.http import Upload
+
 logger = setup_module_logger(__name__, level=logging.INFO)
 
+T = TypeVar("T")
+
+# aliased Raw(...) fields per GraphQL document; larger selections are split into concurrent documents
+RAW_BATCH_SIZE = 10
+
+# structure requests in flight during a CSV export's metadata fan-out
+EXPORT_META_CONCURRENCY = 8
+
+# stream names / variable meta change only through imports or reconfiguration
+META_TTL_S = 900.0
+
+
+_VARIABLE_MAPPING_QUERY = '{ variableMapping(sid: "%s") { columns { name variables { id } } } }'
+
+
+@functools.lru_cache(maxsize=1024)
+def _raw_selection(sid: str, fields: tuple[str, ...]) -> str:
+    """Static head of a stream's ``Raw(...)`` selection; only the window is appended per call."""
+    cols = '", "'.join(("ts", "nanos", *fields))
+    return f'Raw(columns: ["{cols}"], sid: "{sid}", '
+
+
+async def _bounded(sem: asyncio.Semaphore, aw: Awaitable[T]) -> T:
+    async with sem:
+        return await aw
+
 
 def _now_ms() -> int:
     return int(datetime.now(tz=timezone.utc).timestamp() * 1000)
@@ -30,21 +72,141 @@ def _window(start_ms: float, end_ms: float) -> tuple[int, int]:
     return frm, to_ms
 
 
-def _to_frame_from_raw(rows: List[List[Any]], order_vids: Sequence[UUID]) -> pd.DataFrame:
-    ts_ms = pd.Series([int(r[0]) for r in rows], dtype="int64")
-    nanos = pd.Series([int(r[1]) for r in rows], dtype="int64")
-    idx = pd.to_datetime(ts_ms, unit="ms", utc=True) + pd.to_timedelta(nanos, unit="ns")
-    idx.name = "time"
-    vals = {str(vid): [r[i + 2] for r in rows] for i, vid in enumerate(order_vids)}
-    return pd.DataFrame(vals, index=idx)
-
+def _to_frame_from_raw(rows: List[List[Any]], order_vids: Sequence[UUID], points: int = 0) -> pd.DataFrame:
+    import numpy as np
+    import pandas as pd
+
+    cols = [uuid_str(vid) for vid in order_vids]
+    # rows are [ts_ms, nanos, v0, v1, ...]; convert once, then slice columns
+    try:
+        arr = np.asarray(rows, dtype=np.float64)  # ms epochs are exact in float64
+    except (TypeError, ValueError):  # non-numeric values -> type each column on its own
+        return _to_frame_from_mixed_rows(rows, cols, points)
+    ts_ns = arr[:, 0].astype(np.int64) * 1_000_000 + arr[:, 1].astype(np.int64)
+    vals = arr[:, 2:2 + len(cols)]
+
+    n = len(arr)
+    if points and n > points:
+        # reduce to ~points rows by block means over the present samples;
+        # a block turns NaN only if all of its samples are missing
+        step = math.ceil(n / points)
+        starts = np.arange(0, n, step)
+        ts_ns = ts_ns[starts]
+        present = ~np.isnan(vals)
+        sums = np.add.reduceat(np.where(present, vals, 0.0), starts, axis=0)
+        counts = np.add.reduceat(present, starts, axis=0, dtype=np.int64)
+        with np.errstate(invalid="ignore"):
+            vals = sums / counts
+
+    return pd.DataFrame(vals, index=_utc_index(ts_ns), columns=cols, copy=False)
+
+
+def _to_frame_from_mixed_rows(rows: List[List[Any]], cols: List[str], points: int = 0) -> pd.DataFrame:
+    import numpy as np
+    import pandas as pd
+
+    if points and len(rows) > points:
+        # every step-th row (block means are undefined for non-numeric columns);
+        # picked before conversion so only the kept rows are transposed and typed
+        rows = rows[::math.ceil(len(rows) / points)]
+
+    # one transpose pass; numeric columns stay float64, only the others become object
+    columns = list(zip(*rows))
+    ts_ns = np.asarray(columns[0], dtype=np.int64) * 1_000_000 + np.asarray(columns[1], dtype=np.int64)
+    data: Dict[str, Any] = {}
+    for name, col in zip(cols, columns[2:]):
+        try:
+            data[name] = np.asarray(col, dtype=np.float64)
+        except (TypeError, ValueError):
+            data[name] = np.asarray(col, dtype=object)
+
+    return pd.DataFrame(data, index=_utc_index(ts_ns), columns=cols, copy=False)
+
+
+def _utc_index(ts_ns: Any) -> pd.DatetimeIndex:
+    import pandas as pd
+
+    # int64 ns viewed as datetime64 -> one index, no unit parsing or second wrap
+    return pd.DatetimeIndex(ts_ns.view("M8[ns]"), tz="UTC", name="time")
+
+
+# relative spread of sample spacing that still counts as "one equidistant grid"
+_GRID_RTOL = 0.01
+
+
+def _grid_spacing(index: pd.DatetimeIndex) -> Optional[int]:
+    """Sample spacing in ns if ``index`` is (nearly) equidistant, else ``None``."""
+    import numpy as np
+
+    if len(index) < 2:
+        return None
+    spacing = np.diff(index.asi8)
+    median = int(np.median(spacing))
+    if median <= 0 or spacing.max() - spacing.min() > _GRID_RTOL * median:
+        return None
+    return median
+
+
+def _grid_phase(index: pd.DatetimeIndex, grid: pd.DatetimeIndex) -> int:
+    """Largest distance in ns from a sample of ``index`` to its nearest ``grid`` timestamp."""
+    import numpy as np
+
+    ts, ref = index.asi8, grid.asi8
+    pos = np.clip(np.searchsorted(ref, ts), 1, len(ref) - 1)
+    dist = np.minimum(np.abs(ts - ref[pos - 1]), np.abs(ref[pos] - ts))
+    return int(dist.max()) if len(dist) else 0
+
+
+def _join_streams(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Join per-stream frames column-wise on one time axis.
+
+    Frames sharing an index are concatenated as-is. Streams sampled on the same
+    equidistant grid and in phase with the densest stream (every sample within a
+    quarter spacing of one of its timestamps) are aligned onto its timestamps;
+    if that would drop any sample, the frames are outer-joined instead. Anything
+    else is outer-joined: every sample is kept and gaps are NaN.
+    """
+    import pandas as pd
+
+    if len(frames) == 1:
+        return frames[0]
+    # Raw rows arrive time-ordered; only sort the rare frame that is not
+    frames = [f if f.index.is_monotonic_increasing else f.sort_index() for f in frames]
+    base = max(frames, key=len)
+    # identity first: frames of one equidistant window share the cached index object
+    if all(f.index is base.index or f.index.equals(base.index) for f in frames):
+        return pd.concat(frames, axis=1, sort=False)
+
+    spacing = _grid_spacing(base.index)
+    others = [f for f in frames if f is not base]
+    if spacing is not None:
+        half = spacing // 2
+        lo, hi = base.index.asi8[0] - half, base.index.asi8[-1] + half
+        aligned = all(
+            len(f) == 0 or (
+                _grid_spacing(f.index) is not None
+                and abs(_grid_spacing(f.index) - spacing) <= _GRID_RTOL * spacing
+                and lo <= f.index.asi8[0] and f.index.asi8[-1] <= hi
+                and _grid_phase(f.index, base.index) <= spacing // 4
+            )
+            for f in others
+        )
+        if aligned:
+            tolerance = pd.Timedelta(max(half - 1, 0), unit="ns")
+            out = functools.reduce(
+                lambda left, right: pd.merge_asof(
+                    left, right, left_index=True, right_index=True, direction="nearest", tolerance=tolerance
+                ),
+                others,
+                base,
+            )
+            # safety net: nearest matching must not lose a single sample
+            if all((out[c].notna().sum() == f[c].notna().sum()) for f in others for c in f.columns):
+                return out[[c for f in frames for c in f.columns]]  # keep request column order
 
-def _to_frame_from_ts(ts: TimeSeries, order: Sequence[UUID]) -> pd.DataFrame:
-    start_s = ts.AbsoluteStart / 1_000.0
-    delta_s = ts.Delta / 1_000.0
-    idx = pd.to_datetime([start_s + i * delta_s for i in range(len(ts.Values[0]))], unit="s", utc=True)
-    idx.name = "time"
-    return pd.DataFrame({str(uid): ts.Values[i] for i, uid in enumerate(order)}, index=idx)
+    out = pd.concat(frames, axis=1, sort=False)
+    return out if out.index.is_monotonic_increasing else out.sort_index()
 
 
 class CloudGQLDriver(BaseDriver):
@@ -55,16 +217,17 @@ class CloudGQLDriver(BaseDriver):
 
     def __init__(self, auth, http, client_id=None, **kwargs) -> None:
         super().__init__(auth, http, client_id)
-        self._vm_cache: Dict[str, Dict[str, str]] = {}  # sid -> {vid -> field_name}
+        # sid -> {vid -> field_name}; warm-started from the on-disk cache of this tenant
+        self._vm_cache: Dict[str, Dict[str, str]] = load_var_mapping(http.base_url)
+        self._vm_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # memoized structure lookups: sid -> (expires, vid -> meta) and (expires, sid -> name)
+        self._meta_cache: Dict[str, Tuple[float, Dict[str, Dict[str, Any]]]] = {}
+        self._names_cache: Optional[Tuple[float, Dict[str, str]]] = None
 
     # --- infra ---------------------------------------------------------
 
-    async def _bearer(self) -> str:
-        return await self.auth.bearer()
-
     async def _gql(self, query: str) -> Dict[str, Any]:
-        # Auth handled by AsyncHTTP; bearer ensures freshness
-        await self._bearer()
+        # Auth handled by AsyncHTTP (it refreshes the bearer per request)
         res = await self.http.post("/__api__/gql", json={"query": query})
         j = res.json()
         if "errors" in j:
@@ -73,57 +236,75 @@ class CloudGQLDriver(BaseDriver):
 
     async def _vid_to_fieldnames(self, sid: Union[str, UUID, int], vids: List[UUID]) -> List[str]:
         s = str(sid)
-        if s not in self._vm_cache:
-            q = f'''
-            {{
-              variableMapping(sid: "{s}") {{
-                columns {{ name variables {{ id }} }}
-              }}
-            }}'''
-            data = await self._gql(q)
-            idx: Dict[str, str] = {}
-            for col in data["variableMapping"]["columns"]:
-                for v in col.get("variables", []):
-                    idx[str(v["id"])] = col["name"]
-            self._vm_cache[s] = idx
-        out = []
-        for vid in vids:
-            k = str(vid)
-            if k not in self._vm_cache[s]:
-                # fallback to REST variable structure with AddVarMapping
+        keys = [uuid_str(vid) for vid in vids]
+        async with self._vm_locks[s]:  # concurrent fetches of one stream resolve it once
+            idx = self._vm_cache.get(s)
+            changed = idx is None
+            if idx is None:
+                data = await self._gql(_VARIABLE_MAPPING_QUERY % s)
+                idx = {}
+                for col in data["variableMapping"]["columns"]:
+                    for v in col.get("variables", []):
+                        idx[str(v["id"])] = col["name"]
+                self._vm_cache[s] = idx
+
+            if any(k not in idx for k in keys):
+                # fallback to REST variable structure with AddVarMapping, once for all missing vids
                 body = {"AddVarMapping": True, "Sources": [s]}
                 r = await self.http.post("/kafka/structure/sources", json=body)
                 for src in r.json().get("Data", []):
                     for v in src.get("Variables", []):
                         if v.get("Id") and v.get("GQLId"):
-                            self._vm_cache[s][str(v["Id"])] = v["GQLId"]
-            if k not in self._vm_cache[s]:
-                raise KeyError(f"{vid} not found in mapping for {s}")
-            out.append(self._vm_cache[s][k])
-        return out
+                            idx[str(v["Id"])] = v["GQLId"]
+                changed = True
+
+            if changed:
+                # file I/O off the event loop; only stream s is written, under its lock
+                await asyncio.to_thread(save_var_mapping, self.http.base_url, self._vm_cache, [s])
+
+        try:
+            return [idx[k] for k in keys]  # one lookup per vid
+        except KeyError as e:
+            raise KeyError(f"{e.args[0]} not found in mapping for {s}") from None
 
     # --- structure -----------------------------------------------------
 
+    def _invalidate_structure(self) -> None:
+        self._meta_cache.clear()
+        self._names_cache = None
+
     async def list_buffer_sources(self) -> List[GIStream]:
-        await self._bearer()
         r = await self.http.get("/kafka/structure/sources")
-        data = r.json().get("Data", [])
-        return [GIStream.model_validate(s) for s in data]
+        return parse_data_list(GIStream, r.content)
 
     async def list_buffer_variables(self, source_id: Union[str, int, UUID]) -> List[GIStreamVariable]:
-        await self._bearer()
-        body = {"AddVarMapping": True, "Sources": [str(source_id)]}
+        by_sid = await self._stream_variables([str(source_id)])
+        return [v for vs in by_sid.values() for v in vs]
+
+    async def _stream_variables(self, sids: List[str]) -> Dict[str, List[GIStreamVariable]]:
+        """Variables of all ``sids`` from a single structure request."""
+        body = {"AddVarMapping": True, "Sources": sids}
         r = await self.http.post("/kafka/structure/sources", json=body)
-        out: List[GIStreamVariable] = []
+        out: Dict[str, List[GIStreamVariable]] = {}
         for src in r.json().get("Data", []):
             sid = src["Id"]
+            vs = out.setdefault(str(sid), [])
             for v in src.get("Variables", []):
-                out.append(GIStreamVariable.model_validate({
-                    "Id": v["Id"], "Name": v["Name"], "Index": v["Index"], "GQLId": v.get("GQLId"),
-                    "Unit": v.get("Unit", ""), "DataFormat": v.get("DataFormat", ""), "sid": sid
-                }))
+                fields = dict(
+                    id=v.get("Id"), name=v.get("Name"), index=v.get("Index"), gql_id=v.get("GQLId"),
+                    # few distinct units/formats across many variables -> share one str each
+                    unit=sys.intern(v.get("Unit", "")), data_type=sys.intern(v.get("DataFormat", "")), sid=sid,
+                )
+                # absent keys stay absent, so validation (or the required-key check) reports them
+                vs.append(model_from_raw(GIStreamVariable, {k: x for k, x in fields.items() if x is not None}))
         return out
 
+    async def catalog(self) -> GICatalog:
+        online, sources = await asyncio.gather(self.list_variables(), self.list_buffer_sources())
+        # one structure POST for every source instead of one per source
+        variables = await self._stream_variables([str(s.id) for s in sources]) if sources else {}
+        return GICatalog(online_variables=online, sources=sources, variables=variables)
+
     async def list_measurements(
             self,
             source_id: Union[str, int, UUID],
@@ -183,24 +364,28 @@ class CloudGQLDriver(BaseDriver):
         ]
 
     async def list_variables(self) -> list[GIOnlineVariable]:
-        await self._bearer()
         res = await self.http.get("/online/structure/variables")
-        return [GIOnlineVariable.model_validate(d) for d in res.json()["Data"]]
+        return parse_data_list(GIOnlineVariable, res.content)
 
     # --- online --------------------------------------------------------
 
     async def read(self, var_ids: List[UUID]) -> Dict[UUID, float]:
-        await self._bearer()
-        r = await self.http.post("/online/data", json={"Variables": [str(v) for v in var_ids], "Function": "read"})
-        j = r.json()
-        if "Data" not in j: return {}
-        return {vid: val for vid, val in zip(var_ids, j["Data"]["Values"])}
+        vals = await self.read_values([uuid_str(v) for v in var_ids])
+        return {vid: val for vid, val in zip(var_ids, vals)}
 
     async def write(self, mapping: Dict[UUID, float]) -> None:
-        await self._bearer()
+        await self.write_values([uuid_str(v) for v in mapping], list(mapping.values()))
+
+    async def read_values(self, var_ids: Sequence[str]) -> List[float | None]:
+        r = await self.http.post("/online/data", json={"Variables": list(var_ids), "Function": "read"})
+        j = r.json()
+        if "Data" not in j: return []
+        return j["Data"]["Values"]
+
+    async def write_values(self, var_ids: Sequence[str], values: Sequence[float]) -> None:
         await self.http.post("/online/data", json={
-            "Variables": [str(v) for v in mapping.keys()],
-            "Values": list(mapping.values()),
+            "Variables": list(var_ids),
+            "Values": list(values),
             "Function": "write",
         })
 
@@ -214,52 +399,89 @@ class CloudGQLDriver(BaseDriver):
             end_ms: float = 0,
             points: int = 2048,
     ) -> pd.DataFrame:
+        import pandas as pd
+
         frm, to = _window(start_ms, end_ms)
+        selectors = unique_selectors(selectors)  # no repeated columns in the query or the frame
         by_sid: Dict[str, List[UUID]] = defaultdict(list)
         for selector in selectors:
             by_sid[str(selector.SID)].append(selector.VID)
 
-        frames: List[pd.DataFrame] = []
-        for sid, vids in by_sid.items():
-            fields = await self._vid_to_fieldnames(sid, vids)
-            cols = '", "'.join(fields)
-            q = f'''
-            {{
-              Raw(columns: ["ts", "nanos", "{cols}"], sid: "{sid}", from: {frm}, to: {to}) {{
-                data
-              }}
-            }}'''
-            data = await self._gql(q)
-            rows = data.get("Raw", {}).get("data", [])
-            if not rows:
-                continue
-            df = _to_frame_from_raw(rows, vids)
-            if points and len(df) > points:
-                step = max(1, math.ceil(len(df) / points))
-                df = df.iloc[::step]
-            frames.append(df)
+        if not by_sid:
+            return pd.DataFrame()
+
+        sids = list(by_sid)
+        cached = {sid: self._cached_fieldnames(sid, by_sid[sid]) for sid in sids}
+        known = [sid for sid in sids if cached[sid] is not None]
+        unknown = [sid for sid in sids if cached[sid] is None]
+
+        # streams with a complete cached mapping are queried right away, while the others resolve
+        known_task = asyncio.ensure_future(
+            self._raw_rows(known, [cached[sid] for sid in known], frm, to)
+        ) if known else None
+
+        rows_by_sid: Dict[str, List[List[Any]]] = {}
+        try:
+            if unknown:
+                fields = await asyncio.gather(*(self._vid_to_fieldnames(sid, by_sid[sid]) for sid in unknown))
+                rows_by_sid.update(await self._raw_rows(unknown, fields, frm, to))
+        except BaseException:
+            if known_task is not None:
+                known_task.cancel()
+            raise
+
+        if known_task is not None:
+            try:
+                rows_by_sid.update(await known_task)
+            except RuntimeError:
+                # cached (possibly persisted) mapping is stale -> resolve again and retry once
+                logger.info("Raw query with cached field names failed, refreshing mapping")
+                for sid in known:
+                    self._vm_cache.pop(sid, None)
+                fields = await asyncio.gather(*(self._vid_to_fieldnames(sid, by_sid[sid]) for sid in known))
+                rows_by_sid.update(await self._raw_rows(known, fields, frm, to))
+
+        frames: List[pd.DataFrame] = [
+            _to_frame_from_raw(rows_by_sid[sid], by_sid[sid], points)
+            for sid in sids
+            if rows_by_sid.get(sid)
+        ]
 
         if not frames:
             return pd.DataFrame()
-        return pd.concat(frames, axis=1).sort_index()
+        return _join_streams(frames)
 
-    # --- history (unchanged REST) -------------------------------------
+    def _cached_fieldnames(self, sid: str, vids: List[UUID]) -> Optional[List[str]]:
+        """Field names from the mapping cache, or ``None`` if any vid still needs resolving."""
+        idx = self._vm_cache.get(sid)
+        if idx is None:
+            return None
+        try:
+            return [idx[uuid_str(vid)] for vid in vids]
+        except KeyError:
+            return None
+
+    async def _raw_rows(
+            self, sids: List[str], fields: Sequence[List[str]], frm: int, to: int
+    ) -> Dict[str, List[List[Any]]]:
+        """Rows of every stream in ``sids``, ``RAW_BATCH_SIZE`` streams per GraphQL document."""
+        n = RAW_BATCH_SIZE
+        batches = await asyncio.gather(*(
+            self._raw_batch(sids[i:i + n], fields[i:i + n], frm, to) for i in range(0, len(sids), n)
+        ))
+        return {sid: rows for batch in batches for sid, rows in batch.items()}
+
+    async def _raw_batch(
+            self, sids: List[str], fields: Sequence[List[str]], frm: int, to: int
+    ) -> Dict[str, List[List[Any]]]:
+        """Rows of every stream in ``sids`` from one document with an aliased ``Raw(...)`` each."""
+        parts = []
+        for n, (sid, fs) in enumerate(zip(sids, fields)):
+            parts.append(f's{n}: {_raw_selection(sid, tuple(fs))}from: {frm}, to: {to}) {{ data }}')
+        data = await self._gql("{\n  " + "\n  ".join(parts) + "\n}")
+        return {sid: (data.get(f"s{n}") or {}).get("data", []) for n, sid in enumerate(sids)}
 
-    # async def fetch_history(
-    #         self,
-    #         selectors: List[VarSelector],
-    #         *,
-    #         measurement_id: UUID,
-    #         start_ms: float = 0,
-    #         end_ms: float = 0,
-    #         points: int = 2048,
-    # ) -> pd.DataFrame:
-    #     variables = selectors
-    #     var_ids = [s.VID for s in selectors]
-    #     req = BufferRequest(Start=start_ms, End=end_ms, Points=points, Variables=variables)
-    #     r = await self.http.post("/kafka/data", json=req.model_dump(by_alias=True, mode="json"))
-    #     ts = BufferSuccess.model_validate(r.json()).first_timeseries()
-    #     return _to_frame_from_ts(ts, var_ids)
+    # --- history (unchanged REST) -------------------------------------
 
     async def fetch_history(
             self,
@@ -279,13 +501,21 @@ class CloudGQLDriver(BaseDriver):
 
     async def _stream_name(self, sid: Union[str, UUID, int]) -> str:
         s = str(sid)
+        return (await self._stream_names()).get(s, s)
+
+    async def _stream_names(self) -> Dict[str, str]:
+        """str(source id) -> name for all streams, from one structure request (cached ``META_TTL_S``)."""
+        if self._names_cache is not None and time.monotonic() < self._names_cache[0]:
+            return self._names_cache[1]
         r = await self.http.get("/kafka/structure/sources")
-        for src in r.json().get("Data", []):
-            if str(src.get("Id")) == s:
-                return src.get("Name", s)
-        return s
+        names = {str(src.get("Id")): src.get("Name", str(src.get("Id"))) for src in r.json().get("Data", [])}
+        self._names_cache = (time.monotonic() + META_TTL_S, names)
+        return names
 
     async def _var_meta(self, sid: Union[str, UUID, int]) -> Dict[str, Dict[str, Any]]:
+        cached = self._meta_cache.get(str(sid))
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
         body = {"AddVarMapping": True, "Sources": [str(sid)]}
         r = await self.http.post("/kafka/structure/sources", json=body)
         meta: Dict[str, Dict[str, Any]] = {}
@@ -297,6 +527,7 @@ class CloudGQLDriver(BaseDriver):
                     "unit": v.get("Unit", ""),
                     "gql": v.get("GQLId"),
                 }
+        self._meta_cache[str(sid)] = (time.monotonic() + META_TTL_S, meta)
         return meta
 
     async def export(  # csv via GQL exportCSV, udbf via /history/data
@@ -315,8 +546,10 @@ class CloudGQLDriver(BaseDriver):
             csv_settings: Optional[CSVSettings] = None,  # ignored on cloud
             log_settings: Optional[LogSettings] = None,
             target: Optional[str] = None,  # ignored on cloud
+            sink: Optional[Callable[[bytes], Any]] = None,
     ) -> bytes:
         frm, to = _window(start_ms, end_ms)
+        selectors = unique_selectors(selectors)  # no repeated columns in the query or the frame
 
         ENABLE_RAW_QGL_CSV_EXPORT = False  # TODO: renable when raw GraphQL CSV export is fixed
 
@@ -326,45 +559,45 @@ class CloudGQLDriver(BaseDriver):
             # group by stream
             by_sid: Dict[str, List[UUID]] = {}
             for s in selectors:
-                by_sid.setdefault(str(s.SID), []).append(UUID(str(s.VID)))
+                vid = s.VID if isinstance(s.VID, UUID) else UUID(s.VID)
+                by_sid.setdefault(str(s.SID), []).append(vid)
+
+            if is_raw and not ENABLE_RAW_QGL_CSV_EXPORT:
+                # We use the Gantner REST call for RAW here
+                req = request_body(
+                    BufferRequest, selectors, frm, to, points or 2048,
+                    Format="csv", Precision=precision, TimeZone=timezone,
+                )
+
+                if csv_settings is None:
+                    csv_settings = CSVSettings.CSVSettingsDefaultCloud()
+                req["CSVSettings"] = settings_dump(csv_settings, by_alias=True)
+
+                if log_settings:
+                    req["LogSettings"] = settings_dump(log_settings)
+                headers = {"Accept-Encoding": "identity"}
+                r = await self.http.post("/buffer/data", json=req, headers=headers, sink=sink)
+                return r.content
+
+            # field names, variable meta and stream names of all streams in parallel,
+            # at most EXPORT_META_CONCURRENCY requests in flight
+            sids = list(by_sid)
+            sem = asyncio.Semaphore(EXPORT_META_CONCURRENCY)
+            fields_by_sid, meta_by_sid, names = await asyncio.gather(
+                asyncio.gather(*(_bounded(sem, self._vid_to_fieldnames(sid, by_sid[sid])) for sid in sids)),
+                asyncio.gather(*(_bounded(sem, self._var_meta(sid)) for sid in sids)),
+                _bounded(sem, self._stream_names()),
+            )
 
             chunks: List[str] = []
 
-            for sid, vids in by_sid.items():
-                fields = await self._vid_to_fieldnames(sid, vids)
-                meta = await self._var_meta(sid)
-                sname = await self._stream_name(sid)
+            for sid, fields, meta in zip(sids, fields_by_sid, meta_by_sid):
+                sname = names.get(sid, sid)
 
-                for vid, f in zip(vids, fields):
+                for vid, f in zip(by_sid[sid], fields):
                     m = meta.get(str(vid), {"name": str(vid), "unit": ""})
 
                     if is_raw:
-
-                        # We use the Gantner REST call for RAW here
-                        if not ENABLE_RAW_QGL_CSV_EXPORT:
-                            req = BufferRequest(
-                                Start=frm,
-                                End=to,
-                                Variables=selectors,
-                                Points=points or 2048,
-                                Type="equidistant",
-                                Format="csv",
-                                Precision=precision,
-                                TimeZone=timezone,
-                                TimeOffset=0,
-                            ).model_dump(by_alias=True, mode="json")
-
-                            if csv_settings is None:
-                                csv_settings = CSVSettings.CSVSettingsDefaultCloud()
-                            req["CSVSettings"] = csv_settings.model_dump(exclude_none=True, by_alias=True)
-
-                            if log_settings:
-                                req["LogSettings"] = log_settings.model_dump(exclude_none=True)
-                            await self._bearer()
-                            headers = {"Accept-Encoding": "identity"}
-                            r = await self.http.post("/buffer/data", json=req, headers=headers)
-                            return r.content
-
                         # field: "<SID>:<field>"
                         hdr = '", "'.join([m["name"], sname, m["unit"]])
                         chunks.append(
@@ -424,28 +657,19 @@ class CloudGQLDriver(BaseDriver):
                     ") { file } }"
                 )
 
-            await self._bearer()
-            res = await self.http.post("/__api__/gql", json={"query": q})
+            res = await self.http.post("/__api__/gql", json={"query": q}, sink=sink)
             return res.content
 
         if format == "udbf":
-            req = BufferRequest(
-                Start=frm,
-                End=to,
-                Variables=selectors,
-                Points=points or 2048,
-                Type="equidistant",
-                Format="udbf",
-                Precision=precision,
-                TimeZone=timezone,
-                TimeOffset=0,
-            ).model_dump(by_alias=True, mode="json")
+            req = request_body(
+                BufferRequest, selectors, frm, to, points or 2048,
+                Format="udbf", Precision=precision, TimeZone=timezone,
+            )
 
             if log_settings:
-                req["LogSettings"] = log_settings.model_dump(exclude_none=True)
-            await self._bearer()
+                req["LogSettings"] = settings_dump(log_settings)
             headers = {"Accept-Encoding": "identity"}
-            r = await self.http.post("/buffer/data", json=req, headers=headers)
+            r = await self.http.post("/buffer/data", json=req, headers=headers, sink=sink)
             return r.content
 
     async def export_udbf(
@@ -461,18 +685,17 @@ class CloudGQLDriver(BaseDriver):
             precision: int = -1,
     ) -> bytes:
         frm, to = _window(start_ms, end_ms)
-        req = BufferRequest(
-            Start=frm, End=to, Variables=selectors, Points=points or 2048,
-            Type="equidistant", Format="udbf", Precision=precision,
-            TimeZone=timezone, TimeOffset=0
-        ).model_dump(by_alias=True, mode="json")
+        selectors = unique_selectors(selectors)  # no repeated columns in the query or the frame
+        req = request_body(
+            BufferRequest, selectors, frm, to, points or 2048,
+            Format="udbf", Precision=precision, TimeZone=timezone,
+        )
 
         if log_settings:
-            req["LogSettings"] = log_settings.model_dump(exclude_none=True)
+            req["LogSettings"] = settings_dump(log_settings)
         if target:
             req["Target"] = target
 
-        await self._bearer()
         r = await self.http.post("/buffer/data", json=req)
         return r.content
 
@@ -480,7 +703,7 @@ class CloudGQLDriver(BaseDriver):
             self,
             source_id: str,
             source_name: str,
-            file_bytes: bytes,
+            file_bytes: Upload,
             *,
             target: str = "stream",
             csv_settings: Optional[CSVImportSettings] = None,
@@ -501,13 +724,12 @@ class CloudGQLDriver(BaseDriver):
             "SessionTimeoutSec": str(session_timeout_sec),
             "SampleRate": str(sample_rate),
             "AutoCreateMetaData": str(auto_create_metadata).lower(),
-            "CSVSettings": (csv_settings.model_dump(exclude_none=True) if csv_settings else {}),
+            "CSVSettings": (settings_dump(csv_settings) if csv_settings else {}),
             "RetentionTimeSec": retention_time_sec,
             "Target": target,
             "TimeOffsetSec": time_offset_sec,
             "AddTimeSeries": add_time_series,
         }
-        await self._bearer()
         res = await self.http.post("/history/data/import", json=param)
         sid = res.json()["Data"]["SessionID"]
 
@@ -519,13 +741,14 @@ class CloudGQLDriver(BaseDriver):
                 await self.http.delete(f"/history/data/import/{sid}")
             except Exception:
                 logger.exception("Failed to close import session %s", sid)
+            self._invalidate_structure()  # import may have created streams / variables
         return str(sid)
 
     async def import_udbf(
             self,
             source_id: str,
             source_name: str,
-            file_bytes: bytes,
+            file_bytes: Upload,
             *,
             target: str = "stream",
             add_time_series: bool = False,
@@ -545,7 +768,6 @@ class CloudGQLDriver(BaseDriver):
             "AutoCreateMetaData": str(auto_create_metadata).lower(),
             "Target": target,
         }
-        await self._bearer()
         res = await self.http.post("/history/data/import", json=param)
         sid = res.json()["Data"]["SessionID"]
 
@@ -557,4 +779,5 @@ class CloudGQLDriver(BaseDriver):
                 await self.http.delete(f"/history/data/import/{sid}")
             except Exception:
                 logger.exception("Failed to close import session %s", sid)
+            self._invalidate_structure()  # import may have created streams / variables
         return str(sid)
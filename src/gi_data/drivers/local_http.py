@@ -1,25 +1,41 @@
 from __future__ import annotations
 
-import logging
-from typing import Dict, List, Union, Optional, Literal, Iterable
+import sys
+from typing import Any, Callable, Dict, List, Sequence, Union, Optional, Literal, Iterable, TYPE_CHECKING
 from uuid import UUID
 
-import pandas as pd
-
 from gi_data.mapping.models import (
     BufferRequest,
     BufferSuccess,
     GIStream,
     GIStreamVariable,
-    TimeSeries,
-    VarSelector, HistorySuccess, GIHistoryMeasurement, GIOnlineVariable, CSVSettings, LogSettings, CSVImportSettings,
+    VarSelector,
+    var_selector,
+    HistorySuccess,
+    GIHistoryMeasurement,
+    GIOnlineVariable,
+    CSVSettings,
+    LogSettings,
+    CSVImportSettings,
     HistoryRequest,
+    VALIDATE_RESPONSES,
+    model_from_raw,
+    parse_data_list,
+    request_body,
+    settings_dump,
+    unique_selectors,
 )
 from .base import BaseDriver
 from ..mapping.enums import Resolution, DataType
 from ..utils.logging import setup_module_logger
+from ..utils.uuids import uuid_key, uuid_str
+
+if TYPE_CHECKING:
+    import pandas as pd
 
-logger = setup_module_logger(__name__, level=logging.DEBUG)
+    from gi_data.infra.http import Upload
+
+logger = setup_module_logger(__name__)
 
 
 class HTTPTimeSeriesDriver(BaseDriver):
@@ -37,22 +53,28 @@ class HTTPTimeSeriesDriver(BaseDriver):
     # -------- Online -------------------------------------------------
     async def list_variables(self) -> List[GIOnlineVariable]:
         res = await self.http.get("/online/structure/variables")
-        return [GIOnlineVariable.model_validate(d) for d in res.json()["Data"]]
+        return parse_data_list(GIOnlineVariable, res.content)
 
     async def read(self, var_ids: List[UUID] | UUID) -> Dict[UUID, float]:
         # normalize to list
         if isinstance(var_ids, UUID):
             var_ids = [var_ids]
 
-        payload = {"Variables": [str(v) for v in var_ids], "Function": "read"}
-        res = await self.http.post("/online/data", json=payload)
-        vals = res.json()["Data"]["Values"]
+        vals = await self.read_values([uuid_str(v) for v in var_ids])
         return dict(zip(var_ids, vals))
 
     async def write(self, mapping: Dict[UUID, float]) -> None:
+        await self.write_values([uuid_str(v) for v in mapping], list(mapping.values()))
+
+    async def read_values(self, var_ids: Sequence[str]) -> List[float | None]:
+        payload = {"Variables": list(var_ids), "Function": "read"}
+        res = await self.http.post("/online/data", json=payload)
+        return res.json()["Data"]["Values"]
+
+    async def write_values(self, var_ids: Sequence[str], values: Sequence[float]) -> None:
         payload = {
-            "Variables": [str(v) for v in mapping],
-            "Values": list(mapping.values()),
+            "Variables": list(var_ids),
+            "Values": list(values),
             "Function": "write",
         }
         await self.http.post("/online/data", json=payload)
@@ -60,17 +82,22 @@ class HTTPTimeSeriesDriver(BaseDriver):
     # -------- Structure ---------------------------------------------
     async def list_buffer_sources(self) -> List[GIStream]:
         res = await self.http.get(f"/{self._root}/structure/sources")
-        return [GIStream.model_validate(d) for d in res.json()["Data"]]
+        return parse_data_list(GIStream, res.content)
 
     async def list_buffer_variables(
             self, sid: Union[str, int, UUID]
     ) -> List[GIStreamVariable]:
         res = await self.http.get(f"/{self._root}/structure/sources/{sid}/variables")
-        if not res.json().get("Data"):
-            logger.warning(f"Source {sid} has no variables")
+        raw = res.json().get("Data")
+        if not raw:
+            logger.warning("Source %s has no variables", sid)
             return []
-        raw = res.json()["Data"]
-        return [GIStreamVariable.model_validate(r | {"sid": sid}) for r in raw]
+        for r in raw:
+            # few distinct units/formats across many variables -> share one str each
+            for k in ("Unit", "DataFormat"):
+                if isinstance(r.get(k), str):
+                    r[k] = sys.intern(r[k])
+        return [model_from_raw(GIStreamVariable, dict(r, sid=sid)) for r in raw]
 
     async def list_measurements(
             self,
@@ -114,7 +141,7 @@ class HTTPTimeSeriesDriver(BaseDriver):
             json=payload,
         )
 
-        return [GIHistoryMeasurement.model_validate(d) for d in res.json()["Data"]]
+        return parse_data_list(GIHistoryMeasurement, res.content)
 
     # -------- Data ---------------------------------------------------
     async def fetch_buffer(
@@ -125,18 +152,13 @@ class HTTPTimeSeriesDriver(BaseDriver):
             end_ms: float,
             points: int = 2048,
     ) -> pd.DataFrame:
-        vars_ = [s for s in selectors]
-        req = BufferRequest(Start=start_ms, End=end_ms, Points=points, Variables=vars_)
-
-        res = await self.http.post(f"/{self._root}/data",
-                                   json=req.model_dump(by_alias=True, mode="json"))
+        vars_ = unique_selectors(selectors)
+        body = request_body(BufferRequest, vars_, start_ms, end_ms, points)
 
-        if self._root == "history":
-            ts = HistorySuccess.model_validate(res.json()).first_timeseries()
-        else:
-            ts = BufferSuccess.model_validate(res.json()).first_timeseries()
+        res = await self.http.post(f"/{self._root}/data", json=body)
 
-        return _to_frame(ts, [UUID(str(v.VID)) for v in vars_])
+        model = HistorySuccess if self._root == "history" else BufferSuccess
+        return _to_frame(_first_timeseries(res.json(), model), [uuid_key(v.VID) for v in vars_])
 
     async def fetch_history(
             self,
@@ -148,21 +170,9 @@ class HTTPTimeSeriesDriver(BaseDriver):
             points: int = 2048,
     ) -> pd.DataFrame:
         # Apply measurement selection to each selector
-        vars_ = [
-            VarSelector(
-                SID=s.SID,
-                VID=s.VID,
-                Selector=f"mid:{measurement_id}"
-            )
-            for s in selectors
-        ]
-
-        req = HistoryRequest(
-            Start=start_ms,
-            End=end_ms,
-            Variables=vars_,
-            Points=points,
-        )
+        mid = f"mid:{measurement_id}"
+        vars_ = unique_selectors([var_selector(s.SID, s.VID, mid) for s in selectors])
+        body = request_body(HistoryRequest, vars_, start_ms, end_ms, points)
 
         source_id = getattr(self, "_source_id", None)
         if source_id:
@@ -170,13 +180,9 @@ class HTTPTimeSeriesDriver(BaseDriver):
         else:
             url = "/history/data"
 
-        res = await self.http.post(
-            url,
-            json=req.model_dump(by_alias=True, mode="json"),
-        )
+        res = await self.http.post(url, json=body)
 
-        ts = HistorySuccess.model_validate(res.json()).first_timeseries()
-        return _to_frame(ts, [UUID(str(v.VID)) for v in vars_])
+        return _to_frame(_first_timeseries(res.json(), HistorySuccess), [uuid_key(v.VID) for v in vars_])
 
     async def export(  # maps to /{root}/data
             self, selectors: List[VarSelector], *,
@@ -193,27 +199,29 @@ class HTTPTimeSeriesDriver(BaseDriver):
             csv_settings: Optional[CSVSettings] = None,
             log_settings: Optional[LogSettings] = None,
             target: Optional[str] = None,  # local-only for csv -> "stream"/"record"
+            sink: Optional[Callable[[bytes], Any]] = None,
     ) -> bytes:
         fmt = "csv" if format == "csv" else "udbf"
-        req = BufferRequest(
-            Start=start_ms, End=end_ms, Variables=selectors, Points=points or 2048,
-            Type="equidistant", Format=fmt, Precision=precision, TimeZone=timezone, TimeOffset=0
-        ).model_dump(by_alias=True, mode="json")
+        selectors = unique_selectors(selectors)
+        req = request_body(
+            BufferRequest, selectors, start_ms, end_ms, points or 2048,
+            Format=fmt, Precision=precision, TimeZone=timezone,
+        )
         if fmt == "csv":
             settings = csv_settings or CSVSettings()  # default settings
-            req["CSVSettings"] = settings.model_dump(exclude_none=True)
+            req["CSVSettings"] = settings_dump(settings)
         if fmt == "udbf" and log_settings:
-            req["LogSettings"] = log_settings.model_dump(exclude_none=True)
+            req["LogSettings"] = settings_dump(log_settings)
         if fmt == "udbf" and target:
             req["Target"] = target
-        r = await self.http.post(f"/{self._root}/data", json=req)
+        r = await self.http.post(f"/{self._root}/data", json=req, sink=sink)
         return r.content
 
     async def import_csv(
             self,
             source_id: str,
             source_name: str,
-            file_bytes: bytes,
+            file_bytes: Upload,
             *,
             target: str = "stream",
             csv_settings: Optional[CSVImportSettings] = None,
@@ -231,7 +239,7 @@ class HTTPTimeSeriesDriver(BaseDriver):
             "SessionTimeoutSec": str(session_timeout_sec),
             "SampleRate": str(sample_rate),
             "AutoCreateMetaData": str(auto_create_metadata).lower(),
-            "CSVSettings": (csv_settings or CSVImportSettings()).model_dump(exclude_none=True),
+            "CSVSettings": settings_dump(csv_settings or CSVImportSettings()),
             "RetentionTimeSec": retention_time_sec,
             "Target": target,
             "TimeOffsetSec": time_offset_sec,
@@ -256,7 +264,7 @@ class HTTPTimeSeriesDriver(BaseDriver):
             self,
             source_id: str,
             source_name: str,
-            file_bytes: bytes,
+            file_bytes: Upload,
             *,
             target: str = "stream",
             add_time_series: bool = False,
@@ -303,10 +311,29 @@ class HTTPTimeSeriesDriver(BaseDriver):
         await self.http.delete(f"/history/data/import/{session_id}")
 
 
-def _to_frame(ts: TimeSeries, order: List[UUID]) -> pd.DataFrame:
-    start_ns = int(ts.Start * 1_000_000)
-    dt_ns = int(ts.Delta * 1_000_000)
-    idx_ns = [start_ns + i * dt_ns for i in range(len(ts.Values[0]))]
+def _first_timeseries(body: Dict[str, Any], model: type[BufferSuccess]) -> Dict[str, Any]:
+    """
+    Return the first ``TimeSeries`` block of a data response as a plain dict.
 
-    data = {str(uid): ts.Values[i] for i, uid in enumerate(order)}
-    return pd.DataFrame(data, index=idx_ns).rename_axis("timestamp_ns")
+    The values are read straight from the decoded JSON; set ``GI_VALIDATE_RESPONSES=1``
+    to validate the whole response against ``model`` first.
+    """
+    if VALIDATE_RESPONSES:
+        return model.model_validate(body).first_timeseries().model_dump()
+    data = body["Data"]
+    first = data[0] if isinstance(data, list) else data
+    return first["TimeSeries"]
+
+
+def _to_frame(ts: Dict[str, Any], order: List[str]) -> pd.DataFrame:
+    import numpy as np
+    from ..utils.frames import equidistant_index, frame_from_values
+
+    # one C pass into a contiguous float64 buffer; None -> NaN. Popping drops the
+    # decoded float lists (~4x the array's size) before the frame is assembled.
+    values = np.asarray(ts.pop("Values")[:len(order)], dtype=np.float64)
+    size = values.shape[1] if values.ndim == 2 else 0
+    start_ns = int(ts["Start"] * 1_000_000)
+    dt_ns = int(ts["Delta"] * 1_000_000)
+    index = equidistant_index(start_ns, dt_ns, size, name="timestamp_ns")
+    return frame_from_values(values.reshape(len(order), size), order, index)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import (
     AsyncGenerator,
+    Dict,
     Iterable,
     Mapping,
     MutableMapping,
@@ -10,6 +12,8 @@ from typing import (
 )
 from uuid import UUID
 
+import orjson
+
 from gi_data.infra.auth import AuthManager
 from gi_data.infra.http import AsyncHTTP
 from gi_data.infra.ws import AsyncWS
@@ -19,7 +23,7 @@ from gi_data.ws.enums import (
     GInsWSWorkerTypes as WT,
 )
 
-logger = setup_module_logger(__name__, level=logging.DEBUG)
+logger = setup_module_logger(__name__)
 
 
 class WebSocketDriver:
@@ -33,6 +37,8 @@ class WebSocketDriver:
         self._auth = auth
         self._ws = ws
         self._http = http
+        self._pending: Dict[str, Dict[str, float]] = {}  # function -> {vid: value}
+        self._flush_task: asyncio.Task | None = None
 
     async def stream_online(
             self,
@@ -55,10 +61,13 @@ class WebSocketDriver:
         )
 
         while True:
-            hdr, payload = await self._ws.recv()
+            # header first: non-publish frames are dropped without decoding their payload
+            hdr, payload_json = await self._ws.recv_raw()
             if hdr[1] != MT.WSMsgType_Publish:
                 continue
-            logger.debug("Received Payload [WS]: %s", payload)
+            payload = orjson.loads(payload_json)
+            if logger.isEnabledFor(logging.DEBUG):  # per message: skip the call when filtered
+                logger.debug("Received Payload [WS]: %s", payload)
             if not payload:
                 yield {}
                 continue
@@ -113,11 +122,58 @@ class WebSocketDriver:
         * a sequence of ``(uuid, value)`` pairs
         * a dict that is already str-keyed (then left untouched)
         """
-        if isinstance(data, Mapping):
-            mapping = {str(k): v for k, v in data.items()}
-        else:
-            mapping = {str(k): v for k, v in data}
+        await self._send_publish(_str_keyed(data), function)
+
+    async def publish_batch(
+            self,
+            data: Mapping[UUID, float] | MutableMapping[str, float] | Iterable[tuple[UUID, float]],
+            *,
+            function: str = "write",
+            flush_ms: float = 5.0,
+    ) -> None:
+        """
+        Queue values and send everything queued within ``flush_ms`` as one frame.
 
+        Accepts the same `data` shapes as :meth:`publish`. If a variable is
+        queued more than once before the flush, its last value is sent.
+        Call :meth:`flush` to send immediately and surface send errors. A
+        failed background flush keeps its values queued and is re-raised by
+        the next call.
+        """
+        self._pending.setdefault(function, {}).update(_str_keyed(data))
+        task = self._flush_task
+        if task is not None and not task.done():
+            return
+        self._flush_task = None
+        if task is not None and not task.cancelled() and task.exception() is not None:
+            raise task.exception()
+        self._flush_task = asyncio.create_task(self._flush_after(flush_ms / 1000.0))
+
+    async def flush(self) -> None:
+        """Send queued ``publish_batch`` values and wait until they are written."""
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            await task  # at most flush_ms; re-raises a failed background flush
+        await self._send_pending()
+
+    async def _flush_after(self, delay_s: float) -> None:
+        await asyncio.sleep(delay_s)
+        await self._send_pending()
+
+    async def _send_pending(self) -> None:
+        pending, self._pending = self._pending, {}
+        while pending:
+            function, mapping = next(iter(pending.items()))
+            try:
+                await self._send_publish(mapping, function)
+            except BaseException:
+                # put the unsent values back; anything queued meanwhile is newer
+                for fn, unsent in pending.items():
+                    self._pending[fn] = {**unsent, **self._pending.get(fn, {})}
+                raise
+            del pending[function]
+
+    async def _send_publish(self, mapping: Mapping[str, float], function: str) -> None:
         payload = {
             "Variables": list(mapping.keys()),
             "Values": list(mapping.values()),
@@ -131,7 +187,20 @@ class WebSocketDriver:
             "",
         ]
         await self._ws.send(header, payload)
-        logger.debug("Published [WS] %s", payload)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Published [WS] %s", payload)
 
     async def close(self) -> None:
-        await self._ws.close()
+        """Send queued ``publish_batch`` values, then close the socket (also if sending fails)."""
+        try:
+            await self.flush()
+        finally:
+            await self._ws.close()
+
+
+def _str_keyed(
+        data: Mapping[UUID, float] | MutableMapping[str, float] | Iterable[tuple[UUID, float]],
+) -> Dict[str, float]:
+    if isinstance(data, Mapping):
+        return {str(k): v for k, v in data.items()}
+    return {str(k): v for k, v in data}
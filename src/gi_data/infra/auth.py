@@ -1,16 +1,48 @@
 from __future__ import annotations
 
 import asyncio
-import logging
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 import os
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional, MutableMapping
+from typing import Any, Dict, MutableMapping, Optional, Tuple
 
 import httpx
+import orjson
 
 from gi_data.utils.logging import setup_module_logger
 
-logger = setup_module_logger(__name__, level=logging.DEBUG)
+logger = setup_module_logger(__name__)
+
+
+# base url -> CloudEnvironment flag
+_CLOUD_ENV: Dict[str, bool] = {}
+
+# tokens count as expired this long before their real expiry, so a request
+# started just before the deadline does not arrive with a stale token
+_EXPIRY_MARGIN_S = 30
+
+# blocking RPC login calls run here instead of the loop's shared default executor
+_RPC_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gi_data-auth")
+
+# (base url, credentials) -> RPC client; new clients of the same identity reuse its
+# keep-alive connection, different identities never share a cookie jar
+_RPC_CLIENTS: Dict[Tuple[Optional[str], ...], httpx.Client] = {}
+
+
+def _rpc_client(base_url: str, *identity: Optional[str]) -> httpx.Client:
+    key = (base_url, *identity)
+    client = _RPC_CLIENTS.get(key)
+    if client is None or client.is_closed:
+        client = _RPC_CLIENTS[key] = httpx.Client(base_url=f"{base_url}/rpc/", timeout=20.0)
+    return client
+
+
+@atexit.register
+def _close_rpc_clients() -> None:
+    for client in _RPC_CLIENTS.values():
+        client.close()
+    _RPC_CLIENTS.clear()
 
 
 class AuthError(RuntimeError):
@@ -25,8 +57,6 @@ class AuthManager:
     happens exactly once per process.
     """
 
-    _LOCK = asyncio.Lock()
-
     def __init__(
             self,
             base_url: str,
@@ -43,10 +73,18 @@ class AuthManager:
         self._token: Optional[str] = None
         self._refresh: Optional[str] = None
         self._expires: datetime = datetime.min.replace(tzinfo=timezone.utc)
-        self._sync_client = httpx.Client(base_url=f"{self._base}/rpc/", timeout=20.0)
-
-        if not access_token and self._login_required():
-            self._login()
+        self._static = bool(access_token)  # caller-supplied token: nothing to renew
+        self._sync_client = _rpc_client(
+            self._base, self._client_id, self._user, self._pw, self._access_token
+        )
+        # per instance: concurrent bearer() calls of one client trigger one login
+        self._lock = asyncio.Lock()
+        self._login_needed: Optional[bool] = None  # None = not asked yet
+
+        if not access_token:
+            self._login_needed = self._login_required()
+            if self._login_needed:
+                self._login()
 
         if access_token:
             self._token = access_token
@@ -58,17 +96,43 @@ class AuthManager:
         Return a valid `AccessToken`, refreshing or logging-in if necessary.
         Thread-safe for concurrent coroutines.
         """
-        async with self._LOCK:
+        token = self.cached_token()
+        if token is not None:
+            return token  # fast path, no lock
+        if self._login_needed is False:
+            return None  # backend without login: nothing to fetch
+        async with self._lock:
+            # re-check: another coroutine may have logged in while we waited
             if self._token and datetime.now(tz=timezone.utc) < self._expires:
                 return self._token
-            if await asyncio.to_thread(self._login_required):
-                await asyncio.to_thread(self._login)
+            loop = asyncio.get_running_loop()
+            if await loop.run_in_executor(_RPC_POOL, self._login_if_required):
                 if not self._token:
                     raise AuthError("Unable to obtain access token")
                 return self._token
             # No login required; no token needed
             return None
 
+    def cached_token(self) -> Optional[str]:
+        """The current token if it is still valid, else ``None``; never does I/O."""
+        if self._token and datetime.now(tz=timezone.utc) < self._expires:
+            return self._token
+        return None
+
+    def invalidate(self, token: Optional[str]) -> bool:
+        """
+        Drop ``token`` after the backend rejected it (HTTP 401).
+
+        Returns whether :meth:`bearer` can obtain a different token, i.e. whether
+        the rejected request is worth repeating.
+        """
+        if self._static or self._login_needed is False:
+            return False
+        if token is self._token:  # else another request already renewed it
+            self._token = None
+            self._expires = datetime.min.replace(tzinfo=timezone.utc)
+        return True
+
     def bearer_sync(self) -> Optional[str]:
         if self._token and datetime.now(tz=timezone.utc) < self._expires:
             return self._token
@@ -87,12 +151,20 @@ class AuthManager:
 
         res = self._sync_client.post(f"{method}", json=payload, headers=headers)
         res.raise_for_status()
-        return res.json()
+        return orjson.loads(res.content)
 
     def _login_required(self) -> bool:
         body = self._rpc_post("AdminAPI.LoginRequired", {})
         return bool(body.get("LoginRequired", False))
 
+    def _login_if_required(self) -> bool:
+        """Log in when the backend asks for it; one worker hop for both RPCs."""
+        self._login_needed = self._login_required()
+        if not self._login_needed:
+            return False
+        self._login()
+        return True
+
     def _login(self) -> None:
         payload = {
             "ClientID": self._client_id,
@@ -114,9 +186,22 @@ class AuthManager:
         self._token = body.get("AccessToken")
         self._refresh = body.get("RefreshToken")
         lifetime = int(body.get("ExpiresIn", 0))
-        self._expires = datetime.now(tz=timezone.utc) + timedelta(seconds=lifetime)
+        usable = max(lifetime - _EXPIRY_MARGIN_S, lifetime // 2)  # short-lived tokens keep half
+        self._expires = datetime.now(tz=timezone.utc) + timedelta(seconds=usable)
 
     def is_cloud_environment(self) -> bool:
+        """
+        Return whether the backend is GI.cloud.
+
+        The answer is a property of the host, so it is queried once per base URL
+        and process; further clients for the same host skip the RPC round-trips.
+        """
+        cached = _CLOUD_ENV.get(self._base)
+        if cached is None:
+            cached = _CLOUD_ENV[self._base] = self._query_cloud_environment()
+        return cached
+
+    def _query_cloud_environment(self) -> bool:
         # cloud
         try:
             body = self._rpc_post("ConfigAPI.GetGlobalSettings", {})
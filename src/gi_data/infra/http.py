@@ -1,15 +1,56 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 import time
-from typing import Any, Mapping, MutableMapping, Optional
+from typing import Any, AsyncIterable, AsyncIterator, BinaryIO, Callable, Mapping, MutableMapping, Optional, Union
 
 import httpx
+import orjson
 
 from gi_data.infra.auth import AuthManager
 from gi_data.utils.logging import setup_module_logger
 
-logger = setup_module_logger(__name__, level=logging.DEBUG)
+logger = setup_module_logger(__name__)
+
+UPLOAD_CHUNK = 65536
+
+# request bodies that are sent without building one bytes object first
+Upload = Union[bytes, bytearray, memoryview, BinaryIO, AsyncIterable[bytes]]
+
+_JSON_HEADERS = {"content-type": "application/json"}
+_BINARY_HEADERS = {"content-type": "application/octet-stream"}
+
+
+async def _iter_buffer(data: bytearray | memoryview) -> AsyncIterator[bytes]:
+    """Yield ``data`` in upload-sized slices without copying the whole buffer."""
+    view = memoryview(data).cast("B")
+    for pos in range(0, view.nbytes, UPLOAD_CHUNK):
+        yield bytes(view[pos:pos + UPLOAD_CHUNK])
+
+
+async def _iter_file(fh: BinaryIO) -> AsyncIterator[bytes]:
+    """Yield an open binary file in upload-sized chunks; reads run off the event loop."""
+    while chunk := await asyncio.to_thread(fh.read, UPLOAD_CHUNK):
+        yield chunk
+
+
+def _remaining_size(fh: BinaryIO) -> Optional[int]:
+    """Bytes left in ``fh`` from its current position, if it is a regular file."""
+    try:
+        return os.fstat(fh.fileno()).st_size - fh.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+class _Response(httpx.Response):
+    """``httpx.Response`` whose ``json()`` decodes with orjson (Data-API bodies are UTF-8)."""
+
+    def json(self, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().json(**kwargs)
+        return orjson.loads(self.content)
 
 
 class AsyncHTTP:
@@ -26,7 +67,24 @@ class AsyncHTTP:
     ) -> None:
         self._base = base_url.rstrip("/")
         self._auth = auth_manager
-        self._client = httpx.AsyncClient(base_url=self._base, timeout=timeout)
+        # "Bearer <token>" is formatted once per token, not per request
+        self._auth_token: Optional[str] = None
+        self._auth_value = "Bearer None"
+        # HTTP/2 is negotiated via ALPN on https (GI.cloud); plain-http devices stay on HTTP/1.1
+        # (the transport owns pool and protocol settings; retries only repeat failed connects)
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            # keep idle connections for 30 s (httpx default: 5 s) so slow polling avoids new TLS handshakes
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0),
+            retries=1,
+        )
+        self._client = httpx.AsyncClient(base_url=self._base, timeout=timeout, transport=transport)
+
+    def _authorization(self, token: Optional[str]) -> str:
+        if token is not self._auth_token:
+            self._auth_token = token
+            self._auth_value = f"Bearer {token}"
+        return self._auth_value
 
     @property
     def base_url(self) -> str:
@@ -47,11 +105,12 @@ class AsyncHTTP:
             *,
             params: Optional[Mapping[str, Any]] = None,
             json: Any | None = None,
-            content: bytes | None = None,
+            content: Upload | None = None,
             headers: Optional[Mapping[str, str]] = None,
+            sink: Optional[Callable[[bytes], Any]] = None,
     ) -> httpx.Response:
         return await self._request(
-            "POST", url, params=params, json=json, content=content, headers=headers
+            "POST", url, params=params, json=json, content=content, headers=headers, sink=sink
         )
 
     async def delete(
@@ -70,29 +129,58 @@ class AsyncHTTP:
             *,
             params: Optional[Mapping[str, Any]],
             json: Any | None,
-            content: bytes | None = None,
+            content: Upload | None = None,
             headers: Optional[MutableMapping[str, str]] = None,
+            sink: Optional[Callable[[bytes], Any]] = None,
+            retry_auth: bool = True,
     ) -> httpx.Response:
-        final_headers: MutableMapping[str, str] = {}
-        token = await self._auth.bearer()
-        final_headers["authorization"] = f"Bearer {token}"
-
-        if content is not None:
-            final_headers["content-type"] = "application/octet-stream"
-        else:
-            final_headers["content-type"] = "application/json"
+        """
+        Send a request and return the fully read response.
+
+        If ``sink`` is given, the decoded body of a successful response is passed
+        to it chunk by chunk instead of being buffered; the returned response then
+        has an empty body. Error bodies are always buffered for logging.
+
+        A request rejected with 401 is repeated once with a fresh token, unless
+        its body was streamed from a file or iterator.
+        """
+        replayable = content is None or isinstance(content, (bytes, bytearray, memoryview, str))
+        request_args = dict(params=params, json=json, content=content, headers=headers, sink=sink)
+        token = self._auth.cached_token()
+        if token is None:  # expired / not logged in yet -> may refresh
+            token = await self._auth.bearer()
+        final_headers: MutableMapping[str, str] = dict(
+            _BINARY_HEADERS if content is not None else _JSON_HEADERS, authorization=self._authorization(token)
+        )
 
         if headers:
             final_headers.update(headers)
 
-        logger.debug(
-            "Request: %s %s%s | Params: %s | Payload: %s",
-            method,
-            self._base,
-            url,
-            params if params else "None",
-            "(bytes)" if content is not None else (json if json else "None"),
-        )
+        if isinstance(content, (bytearray, memoryview)):
+            # stream mutable buffers in slices instead of copying them into one bytes object
+            final_headers["content-length"] = str(memoryview(content).nbytes)
+            content = _iter_buffer(content)
+        elif hasattr(content, "read"):
+            # file objects are streamed from their current position
+            size = _remaining_size(content)
+            if size is not None:
+                final_headers["content-length"] = str(size)
+            content = _iter_file(content)
+
+        if logger.isEnabledFor(logging.DEBUG):  # skip building the record for large payloads
+            logger.debug(
+                "Request: %s %s%s | Params: %s | Payload: %s",
+                method,
+                self._base,
+                url,
+                params if params else "None",
+                "(bytes)" if content is not None else (json if json else "None"),
+            )
+
+        if content is None and json is not None:
+            # orjson encodes much faster than httpx's stdlib json.dumps
+            content = orjson.dumps(json, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+            json = None
 
         CHUNK = 65536
         LOG_EVERY_SEC = 15.0
@@ -109,13 +197,27 @@ class AsyncHTTP:
                 json=json,
                 content=content,
         ) as resp:
+            if (
+                    resp.status_code == 401 and retry_auth and replayable
+                    and self._auth.invalidate(token)
+            ):
+                await resp.aclose()
+                logger.info("Token rejected for %s %s, retrying with a fresh one", method, url)
+                return await self._request(method, url, **request_args, retry_auth=False)
             total = int(resp.headers.get("content-length") or 0)
             downloaded = 0
             buf = bytearray()
 
-            async for chunk in resp.aiter_raw(CHUNK):
+            to_sink = sink is not None and not resp.is_error
+            # raw chunks are decoded by the re-built response below; a sink gets decoded bytes
+            chunks = resp.aiter_bytes(CHUNK) if to_sink else resp.aiter_raw(CHUNK)
+
+            async for chunk in chunks:
                 downloaded += len(chunk)
-                buf.extend(chunk)
+                if to_sink:
+                    sink(chunk)
+                else:
+                    buf.extend(chunk)
 
                 now = time.monotonic()
 
@@ -138,16 +240,21 @@ class AsyncHTTP:
                     logger.info("Download completed: %.1f%% (%d/%d)", pct, downloaded, total)
                 else:
                     logger.info("Download completed: %d bytes", downloaded)
-            out = httpx.Response(
+            out_headers = resp.headers
+            if to_sink:
+                out_headers = resp.headers.copy()
+                out_headers.pop("content-encoding", None)
+            out = _Response(
                 status_code=resp.status_code,
-                headers=resp.headers,
+                headers=out_headers,
                 content=bytes(buf),
                 request=resp.request,
             )
             try:
                 out.raise_for_status()
             except httpx.HTTPStatusError:
-                body = out.text
+                # full error body only at DEBUG; the first 500 chars are enough otherwise
+                body = out.text if logger.isEnabledFor(logging.DEBUG) else out.text[:500]
                 logger.error(
                     "HTTP error response for %s %s%s [%s]: %s",
                     method,
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 import logging
 import ssl
 from typing import Any, List, Tuple
 
 import websockets
 import certifi
+import orjson
 
 from gi_data.infra.auth import AuthManager
 
@@ -20,6 +20,10 @@ class AsyncWS:
     """
 
     VERSION_BYTE: bytes = b"\x00"
+    WRITE_LIMIT: int = 2 ** 20  # buffered bytes before send() waits for the socket to drain
+    MAX_SIZE: int = 2 ** 22  # largest accepted incoming frame
+    # small tick frames barely compress; permessage-deflate would cost CPU per frame on both ends
+    COMPRESSION: str | None = None
 
     def __init__(self, base_url: str, auth: AuthManager) -> None:
         base = base_url.rstrip("/")
@@ -42,7 +46,15 @@ class AsyncWS:
         ssl_ctx = ssl.create_default_context(cafile=certifi.where()) if uri.startswith("wss://") else None
 
         try:
-            self._ws = await websockets.connect(uri, ssl=ssl_ctx, ping_interval=None, ping_timeout=None)
+            self._ws = await websockets.connect(
+                uri,
+                ssl=ssl_ctx,
+                ping_interval=None,
+                ping_timeout=None,
+                write_limit=self.WRITE_LIMIT,
+                max_size=self.MAX_SIZE,
+                compression=self.COMPRESSION,
+            )
             log.debug("WebSocket connected to %s", uri)
         except Exception as e:
             log.error("Failed to connect WebSocket: %s", e)
@@ -57,8 +69,9 @@ class AsyncWS:
         if not self.connected:
             await self.connect()
 
-        header_json = json.dumps(header, separators=(",", ":")).encode()
-        payload_json = json.dumps(payload or {}, separators=(",", ":")).encode()
+        # orjson emits compact UTF-8 bytes directly (UUIDs included), no separate encode step
+        header_json = orjson.dumps(header)
+        payload_json = orjson.dumps(payload or {}, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
 
         frame = (
             self.VERSION_BYTE
@@ -74,6 +87,11 @@ class AsyncWS:
             raise
 
     async def recv(self) -> Tuple[List[Any], Any]:
+        header, payload_json = await self.recv_raw()
+        return header, orjson.loads(payload_json)
+
+    async def recv_raw(self) -> Tuple[List[Any], memoryview]:
+        """Like ``recv`` but leaves the payload undecoded, so callers can skip frames by header."""
         if not self.connected:
             await self.connect()
 
@@ -82,11 +100,10 @@ class AsyncWS:
             if not raw or raw[0:1] != self.VERSION_BYTE:
                 raise RuntimeError("Invalid frame received")
 
-            header_len = int.from_bytes(raw[1:3], "little")
-            header_json = raw[3:3 + header_len].decode()
-            payload_json = raw[3 + header_len:].decode()
-
-            return json.loads(header_json), json.loads(payload_json)
+            # orjson parses the UTF-8 bytes in place: no str decode / slice copies per frame
+            view = memoryview(raw)
+            header_len = int.from_bytes(view[1:3], "little")
+            return orjson.loads(view[3:3 + header_len]), view[3 + header_len:]
         except Exception as e:
             log.error("Failed to receive WebSocket message: %s", e)
             raise
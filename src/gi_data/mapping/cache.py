@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+import orjson
+
+from gi_data.utils.logging import setup_module_logger
+
+logger = setup_module_logger(__name__, level=logging.INFO)
+
+VarMapping = Dict[str, Dict[str, str]]  # sid -> {vid -> GraphQL field name}
+
+# persisted field names are trusted for this long; stale ones are also caught by the query retry
+MAPPING_TTL_S = 24 * 3600.0
+
+# saves run in worker threads (one per changed stream); one at a time per process
+_SAVE_LOCK = threading.Lock()
+
+
+def _cache_file(base_url: str) -> Path:
+    root = Path(os.getenv("GI_CACHE_DIR") or Path.home() / ".cache" / "gi_data")
+    tenant = re.sub(r"[^A-Za-z0-9_.-]", "_", urlsplit(base_url).netloc or base_url)
+    return root / f"{tenant}.vm.json"
+
+
+def _read_entries(path: Path) -> Dict[str, Dict[str, Any]]:
+    # on disk: sid -> {"saved": epoch s, "fields": {vid -> field name}}; expired / legacy entries dropped
+    try:
+        raw = orjson.loads(path.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.debug("Ignoring unreadable mapping cache %s: %s", path, e)
+        return {}
+    if not isinstance(raw, dict):
+        return {}
+    oldest = time.time() - MAPPING_TTL_S
+    return {
+        sid: e for sid, e in raw.items()
+        if isinstance(e, dict) and isinstance(e.get("fields"), dict) and e.get("saved", 0) >= oldest
+    }
+
+
+def load_var_mapping(base_url: str) -> VarMapping:
+    """Return the persisted, unexpired variable mapping of a tenant (empty if none / unreadable)."""
+    return {sid: e["fields"] for sid, e in _read_entries(_cache_file(base_url)).items()}
+
+
+def save_var_mapping(base_url: str, mapping: VarMapping, sids: Optional[Iterable[str]] = None) -> None:
+    """
+    Persist the variable mapping of a tenant (best effort, atomic replace).
+
+    Only the streams in ``sids`` (default: all of ``mapping``) are written; the file's
+    other streams are kept, so drivers / processes sharing a tenant don't discard
+    each other's entries. Entries expire after ``MAPPING_TTL_S``.
+    """
+    path = _cache_file(base_url)
+    with _SAVE_LOCK:
+        entries = _read_entries(path)
+        now = time.time()
+        for sid in list(mapping if sids is None else sids):
+            # a stream's entry is replaced whole: a refreshed mapping must not keep stale fields
+            entries[sid] = {"saved": now, "fields": dict(mapping.get(sid, {}))}
+        data = orjson.dumps(entries)
+        tmp = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # unique temp file: concurrent writers (threads or processes) never share one
+            with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, suffix=".tmp", delete=False) as fh:
+                tmp = fh.name
+                fh.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug("Could not write mapping cache %s: %s", path, e)
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
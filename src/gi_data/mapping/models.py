@@ -1,22 +1,50 @@
 from __future__ import annotations
 
-from typing import List, Union, Optional, TYPE_CHECKING
+import functools
+import os
+from typing import Any, Dict, Generic, List, Sequence, TypeVar, Union, Optional, TYPE_CHECKING
 from uuid import UUID
 
-from pydantic import BaseModel, Field, PrivateAttr
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 if TYPE_CHECKING:
     from gi_data import GIDataClient
 
+# shared by the frozen models; extra keys are ignored (pydantic default)
+_FROZEN = ConfigDict(validate_by_name=True, frozen=True, extra="ignore")
+
+# GI_VALIDATE_RESPONSES=1 validates data responses (TimeSeries) too (schema drift checks)
+VALIDATE_RESPONSES = os.getenv("GI_VALIDATE_RESPONSES") == "1"
+# GI_TRUST_RESPONSES=1 builds structure listings without validation (required keys are still checked)
+TRUST_RESPONSES = os.getenv("GI_TRUST_RESPONSES") == "1" and not VALIDATE_RESPONSES
+
 
 class VarSelector(BaseModel):
     SID: Union[UUID, str, int] | None = None
     VID: UUID | str
     Selector: str = Field(default="latest")  # latest=buffer | or measurement ID
 
-    class Config:
-        validate_by_name = True
-        frozen = True
+    model_config = _FROZEN
+
+
+@functools.lru_cache(maxsize=4096)
+def var_selector(
+        SID: Union[UUID, str, int] | None,
+        VID: UUID | str,
+        Selector: str = "latest",
+) -> VarSelector:
+    """Return a shared ``VarSelector`` (frozen, so one instance per id triple is enough)."""
+    return VarSelector(SID=SID, VID=VID, Selector=Selector)
+
+
+def unique_selectors(selectors: Sequence[VarSelector]) -> tuple[VarSelector, ...]:
+    """``selectors`` without repeats of the same (SID, VID, Selector), first occurrence kept."""
+    from gi_data.utils.uuids import uuid_key
+
+    seen: Dict[tuple, VarSelector] = {}
+    for s in selectors:
+        seen.setdefault((str(s.SID), uuid_key(s.VID), s.Selector), s)
+    return tuple(seen.values())
 
 
 class BufferRequest(BaseModel):
@@ -30,9 +58,7 @@ class BufferRequest(BaseModel):
     TimeZone: str = "UTC"  # Europe/Vienna
     TimeOffset: int = 0
 
-    class Config:
-        validate_by_name = True
-        frozen = True
+    model_config = _FROZEN
 
 
 class TimeSeries(BaseModel):
@@ -48,22 +74,30 @@ class TimeSeries(BaseModel):
     Updating: bool | None = None
     Values: List[List[float | None]]
 
-    class Config:
-        validate_by_name = True
-        frozen = True
-
-
-class _Item(BaseModel):
-    TimeSeries: TimeSeries
+    model_config = ConfigDict(**_FROZEN, defer_build=True)  # only validated with GI_VALIDATE_RESPONSES=1
 
 
 class BufferSuccess(BaseModel):
     Success: bool
-    Data: Union[_Item, List[_Item]]
+    Data: List[TimeSeries]
+
+    model_config = ConfigDict(defer_build=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _unwrap(cls, v: Any) -> Any:
+        # {"Data": {"TimeSeries": {...}}} or a list of those -> flat list of TimeSeries
+        if not isinstance(v, dict):
+            return v
+        data = v.get("Data")
+        if isinstance(data, dict):
+            data = [data]
+        if isinstance(data, list):
+            v = dict(v, Data=[d.get("TimeSeries", d) if isinstance(d, dict) else d for d in data])
+        return v
 
     def first_timeseries(self) -> TimeSeries:
-        first = self.Data[0] if isinstance(self.Data, list) else self.Data
-        return first.TimeSeries
+        return self.Data[0]
 
 
 class HistorySuccess(BufferSuccess):
@@ -72,15 +106,14 @@ class HistorySuccess(BufferSuccess):
 
 class GIStream(BaseModel):
     name: str = Field(alias="Name")
-    id: Union[str, UUID, int] = Field(alias="Id")
+    # str first + left_to_right: JSON ids match the first branch, no smart-union scoring
+    id: Union[str, UUID, int] = Field(alias="Id", union_mode="left_to_right")
     sample_rate_hz: float = Field(alias="SampleRateHz")
     first_ts: float = Field(alias="AbsoluteStart")
     last_ts: float = Field(alias="LastTimeStamp")
     index: int = Field(alias="Index")
 
-    class Config:
-        validate_by_name = True
-        frozen = True
+    model_config = _FROZEN
 
 
 class GIStreamVariable(BaseModel):
@@ -90,11 +123,9 @@ class GIStreamVariable(BaseModel):
     index: int = Field(alias="Index")
     unit: str = Field(alias="Unit")
     data_type: str = Field(alias="DataFormat")
-    sid: Union[str, int, UUID]
+    sid: Union[str, int, UUID] = Field(union_mode="left_to_right")
 
-    class Config:
-        validate_by_name = True
-        frozen = True
+    model_config = _FROZEN
 
 
 class GIOnlineVariable(BaseModel):
@@ -111,10 +142,17 @@ class GIOnlineVariable(BaseModel):
     range_min: float | None = Field(alias="RangeMin")
     range_max: float | None = Field(alias="RangeMax")
 
-    class Config:
-        validate_by_name = True
-        frozen = True
-        extra = "ignore"
+    model_config = _FROZEN
+
+
+class GICatalog(BaseModel):
+    """Snapshot of online variables, buffer sources and their variables."""
+
+    online_variables: List[GIOnlineVariable]
+    sources: List[GIStream]
+    variables: Dict[str, List[GIStreamVariable]]  # str(source id) -> variables
+
+    model_config = ConfigDict(frozen=True)
 
 
 class HistoryRequest(BaseModel):
@@ -129,9 +167,39 @@ class HistoryRequest(BaseModel):
     TimeOffset: int = 0
     AddVarMapping: bool = True
 
-    class Config:
-        validate_by_name = True
-        frozen = True
+    model_config = _FROZEN
+
+
+@functools.lru_cache(maxsize=1024)
+def _body_template(
+        model: type[BufferRequest | HistoryRequest],
+        selectors: tuple[VarSelector, ...],
+        **static: Any,
+) -> Dict[str, Any]:
+    # validated and dumped once per (selectors, static fields); per call only the window changes
+    return model(Variables=list(selectors), **static).model_dump(by_alias=True, mode="json")
+
+
+def request_body(
+        model: type[BufferRequest | HistoryRequest],
+        selectors: Sequence[VarSelector],
+        start_ms: float,
+        end_ms: float,
+        points: int,
+        **static: Any,
+) -> Dict[str, Any]:
+    """
+    JSON body of a ``BufferRequest`` / ``HistoryRequest`` for ``selectors``.
+
+    Equivalent to ``model(...).model_dump(by_alias=True, mode="json")``, but the
+    dump is cached per selector tuple and ``static`` fields (e.g. ``Format``), so
+    repeated requests only copy it and fill in ``Start``, ``End`` and ``Points``.
+    """
+    body = dict(_body_template(model, tuple(selectors), **static))
+    body["Start"] = float(start_ms)
+    body["End"] = float(end_ms)
+    body["Points"] = int(points)
+    return body
 
 
 class GIHistoryVariable(BaseModel):
@@ -149,7 +217,7 @@ class GIHistoryVariable(BaseModel):
     unit: str = Field(alias="Unit")
     internal_id: Optional[str] = Field(alias="_id", default=None)
 
-    model_config = dict(validate_by_name=True, frozen=True, extra="ignore")
+    model_config = _FROZEN
 
 
 class GIHistoryMeasurement(BaseModel):
@@ -179,7 +247,7 @@ class GIHistoryMeasurement(BaseModel):
     # Internal reference to client, set by DataClient.list_history_measurements
     _client: Optional["GIDataClient"] = PrivateAttr(default=None)
 
-    model_config = dict(
+    model_config = ConfigDict(
         validate_by_name=True,
         frozen=False,
         extra="ignore",
@@ -208,6 +276,45 @@ class GIHistoryMeasurement(BaseModel):
         return vars
 
 
+M = TypeVar("M", bound=BaseModel)
+
+
+class DataList(BaseModel, Generic[M]):
+    """``{"Data": [...]}`` list response of the Data-API."""
+
+    Data: List[M] = Field(default_factory=list)
+
+
+@functools.lru_cache(maxsize=None)
+def _data_list(model: type[M]) -> type[DataList[M]]:
+    # DataList[model] re-resolves the parametrization on every subscription
+    return DataList[model]
+
+
+@functools.lru_cache(maxsize=None)
+def _required_keys(model: type[BaseModel]) -> tuple[tuple[str, str], ...]:
+    # (field name, alias) of every required field
+    return tuple((name, f.alias or name) for name, f in model.model_fields.items() if f.is_required())
+
+
+def model_from_raw(model: type[M], data: Dict[str, Any]) -> M:
+    """
+    ``model.model_validate(data)``; with ``GI_TRUST_RESPONSES=1`` a ``model_construct``
+    instead, after checking that every required field is present.
+    """
+    if not TRUST_RESPONSES:
+        return model.model_validate(data)
+    missing = [alias for name, alias in _required_keys(model) if alias not in data and name not in data]
+    if missing:
+        raise ValueError(f"{model.__name__} response is missing {missing}")
+    return model.model_construct(**data)
+
+
+def parse_data_list(model: type[M], content: bytes) -> List[M]:
+    """Decode a ``{"Data": [...]}`` body straight from its JSON bytes into ``model`` items in one pass."""
+    return _data_list(model).model_validate_json(content).Data
+
+
 class CSVSettings(BaseModel):
     HeaderText: Optional[str] = None
     AddColumnHeader: bool = True
@@ -220,7 +327,7 @@ class CSVSettings(BaseModel):
     ValuesStartRowIndex: Optional[int] = None
     ValuesStartColumnIndex: Optional[int] = None
 
-    model_config = dict(validate_by_name=True, frozen=True)
+    model_config = _FROZEN
 
     def CSVSettingsDefaultCloud() -> CSVSettings:
         return CSVSettings(
@@ -246,6 +353,8 @@ class CSVImportSettings(BaseModel):
     DateTimeFmtColumn2: str = ""
     DateTimeFmtColumn3: str = ""
 
+    model_config = _FROZEN
+
 
 class CSVImportSettingsDefaultCloud(CSVImportSettings):
     NameRowIndex: int = 0
@@ -256,9 +365,15 @@ class CSVImportSettingsDefaultCloud(CSVImportSettings):
     DateTimeFmtColumn1: str = "%Y-%m-%d %H:%M:%S.%F"
 
 
+@functools.lru_cache(maxsize=64)
+def settings_dump(settings: BaseModel, *, by_alias: bool = False) -> Dict[str, Any]:
+    """``settings.model_dump(exclude_none=True)`` of a frozen settings model, cached; treat as read-only."""
+    return settings.model_dump(exclude_none=True, by_alias=by_alias)
+
+
 class LogSettings(BaseModel):
     SourceID: str
     SourceName: str
     MeasurementName: Optional[str] = None
 
-    model_config = dict(validate_by_name=True, frozen=True)
+    model_config = _FROZEN
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import weakref
+from typing import Any, Literal, Sequence
+
+import numpy as np
+import pandas as pd
+
+# (start_ns, delta_ns, size, utc) -> axis values; entries vanish once no index uses them
+_AXIS_CACHE: "weakref.WeakValueDictionary[tuple, Any]" = weakref.WeakValueDictionary()
+
+
+def equidistant_index(
+        start_ns: int,
+        delta_ns: int,
+        size: int,
+        *,
+        name: str,
+        utc: bool = False,
+) -> pd.Index:
+    """
+    Return the time axis ``start_ns + i * delta_ns`` for ``i < size``.
+
+    Identical axes share their values: the timestamps are cached weakly, so
+    repeated fetches of the same window reuse one array while any frame
+    references it. Each call returns its own Index object, so renaming the
+    index of one frame does not affect the others.
+
+    Args:
+        start_ns: First timestamp in nanoseconds since epoch.
+        delta_ns: Sample distance in nanoseconds.
+        size: Number of samples.
+        name: Index name.
+        utc: Return a UTC ``DatetimeIndex`` instead of raw int64 nanoseconds.
+
+    Returns:
+        Index over shared values (Index objects themselves are never shared).
+    """
+    key = (start_ns, delta_ns, size, utc)
+    values = _AXIS_CACHE.get(key)
+    if values is None:
+        idx_ns = np.arange(size, dtype=np.int64)
+        idx_ns *= delta_ns  # in place: one allocation for the whole axis
+        idx_ns += start_ns
+        idx_ns.flags.writeable = False
+        if utc:
+            # localise once here; building from the DatetimeArray below is copy-free
+            values = pd.DatetimeIndex(idx_ns.view("M8[ns]"), tz="UTC").array
+        else:
+            values = idx_ns
+        _AXIS_CACHE[key] = values
+    if utc:
+        return pd.DatetimeIndex(values, name=name, copy=False)
+    return pd.Index(values, dtype="int64", name=name, copy=False)
+
+
+def frame_from_values(
+        values: Sequence[Sequence[float | None]],
+        columns: Sequence[str],
+        index: pd.Index,
+        *,
+        copy: bool = False,
+) -> pd.DataFrame:
+    """
+    Build a DataFrame from column-major ``values`` (``values[col][row]``).
+
+    The values are stacked into one contiguous float64 array which pandas
+    adopts as a single block, so no per-column consolidation takes place.
+    ``None`` entries become ``NaN``.
+
+    Args:
+        values: One sequence of samples per column.
+        columns: Column labels, one per used entry of ``values``.
+        index: Row index shared by all columns.
+        copy: Copy the stacked array into the frame instead of wrapping it.
+
+    Returns:
+        DataFrame with a single float64 block.
+    """
+    arr = np.asarray(values[:len(columns)], dtype=np.float64)
+    if arr.ndim != 2:
+        arr = arr.reshape(len(columns), len(index))
+    # pandas stores blocks as (columns, rows) -> arr.T wraps arr without a copy
+    return pd.DataFrame(arr.T, index=index, columns=list(columns), copy=copy)
+
+
+FrameBackend = Literal["pandas", "arrow", "polars"]
+
+
+def convert_frame(df: pd.DataFrame, backend: FrameBackend = "pandas") -> Any:
+    """
+    Convert a fetched frame to the requested backend.
+
+    ``"arrow"`` returns a ``pyarrow.Table`` with the time index as first column,
+    ``"polars"`` a ``polars.DataFrame`` built from that table (no rechunk).
+    Requires the ``pygidata[arrow]`` / ``pygidata[polars]`` extras.
+    """
+    if backend == "pandas":
+        return df
+    if backend not in ("arrow", "polars"):
+        raise ValueError(f"Unknown frame backend: {backend!r}")
+
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise ImportError(f"backend={backend!r} requires pyarrow (pip install pygidata[{backend}])") from e
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    if backend == "arrow":
+        return table
+
+    try:
+        import polars as pl
+    except ImportError as e:
+        raise ImportError("backend='polars' requires polars (pip install pygidata[polars])") from e
+    return pl.from_arrow(table, rechunk=False)
@@ -1,10 +1,19 @@
+import functools
 import logging
 
+_FORMATTER = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
+
+@functools.lru_cache(maxsize=None)
 def setup_module_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """
     Configures and returns a logger for the given module name.
     Adds a StreamHandler with a simple formatter if no handlers are present.
+    Repeated calls with the same arguments return the configured logger.
+
+    Log with %-style arguments (``logger.debug("x=%s", x)``), not f-strings, so
+    values are only formatted when a handler emits the record; per-message
+    debug lines should also be guarded by ``logger.isEnabledFor(logging.DEBUG)``.
 
     Args:
         name: The module name (usually __name__).
@@ -18,10 +27,7 @@ def setup_module_logger(name: str, level: int = logging.INFO) -> logging.Logger:
 
     if not logger.hasHandlers():
         handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FORMATTER)
         logger.addHandler(handler)
 
     return logger
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import functools
+from typing import Iterable, List, Union, TYPE_CHECKING
+from uuid import UUID
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@functools.lru_cache(maxsize=65536)
+def uuid_str(uid: Union[UUID, str]) -> str:
+    """``str(uid)``, memoized: polling loops pass the same ids over and over."""
+    return str(uid)
+
+
+@functools.lru_cache(maxsize=65536)
+def uuid_key(uid: Union[UUID, str]) -> str:
+    """Canonical (lower-case, hyphenated) string of a UUID or UUID string, memoized; other ids pass through."""
+    if isinstance(uid, UUID):
+        return str(uid)
+    try:
+        return str(UUID(str(uid)))
+    except ValueError:
+        return str(uid)
+
+
+def uuid_array(ids: Iterable[UUID]) -> np.ndarray:
+    """Pack UUIDs into an ``(N, 16)`` uint8 array of their raw bytes."""
+    import numpy as np
+
+    return np.frombuffer(b"".join(u.bytes for u in ids), dtype=np.uint8).reshape(-1, 16)
+
+
+def uuid_strings(ids: np.ndarray) -> List[str]:
+    """
+    Format an ``(N, 16)`` uint8 array of raw UUID bytes as canonical UUID strings.
+
+    Hex-encodes the whole array in one call instead of building N ``UUID`` objects.
+    """
+    import numpy as np
+
+    h = np.ascontiguousarray(ids, dtype=np.uint8).reshape(-1, 16).tobytes().hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, len(h), 32)
+    ]
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class WindowCache:
+    """
+    LRU of fetched time windows, for absolute ranges that lie in the past.
+
+    A request spanning ``span`` ms is widened to an aligned chunk of at least
+    ``2 * span`` ms at the same sample density. Chunks overlap by half, so any
+    window of the same span that scrolls inside a chunk is sliced from memory
+    instead of fetched again. Concurrent misses on one chunk share a single fetch,
+    and every caller gets its own copy of the slice.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 2**20) -> None:
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._frames: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+        self._inflight: Dict[tuple, asyncio.Future] = {}  # chunk key -> fetch in progress
+
+    @staticmethod
+    def cacheable(start_ms: float, end_ms: float) -> bool:
+        """Only absolute windows (epoch ms) are cached; relative ones move with "now"."""
+        return 0 < start_ms < end_ms
+
+    async def fetch(
+            self,
+            key: tuple,
+            fetch: Callable[..., Awaitable[pd.DataFrame]],
+            *,
+            start_ms: float,
+            end_ms: float,
+            points: int,
+    ) -> pd.DataFrame:
+        """
+        Return ``fetch(start_ms=, end_ms=, points=)`` for the window, served from a cached chunk if possible.
+
+        Args:
+            key: Identifies the series (e.g. domain and selectors).
+            fetch: Coroutine function loading a window.
+            start_ms: Window start in epoch ms.
+            end_ms: Window end in epoch ms.
+            points: Requested samples for the window.
+        """
+        span = end_ms - start_ms
+        chunk_ms = 1 << max(1, math.ceil(math.log2(2 * span)))
+        half = chunk_ms // 2
+        lo = (int(start_ms) // half) * half
+        hi = lo + chunk_ms
+        if hi > time.time() * 1000:  # chunk still receiving data -> don't pin it
+            return await fetch(start_ms=start_ms, end_ms=end_ms, points=points)
+
+        chunk_key = (*key, lo, chunk_ms, math.ceil(points * chunk_ms / span))
+        df = self._frames.get(chunk_key)
+        if df is not None:
+            self._frames.move_to_end(chunk_key)
+        elif chunk_key in self._inflight:
+            # shield: a cancelled waiter must not cancel the fetch others wait for
+            df = await asyncio.shield(self._inflight[chunk_key])
+        else:
+            df = await self._fetch_chunk(chunk_key, fetch, lo, hi)
+        # a copy: callers may modify their frame in place without touching the cached chunk
+        return _slice(df, start_ms, end_ms).copy()
+
+    async def _fetch_chunk(self, chunk_key: tuple, fetch, lo: int, hi: int) -> pd.DataFrame:
+        fut = asyncio.get_running_loop().create_future()
+        self._inflight[chunk_key] = fut
+        try:
+            df = await fetch(start_ms=lo, end_ms=hi, points=chunk_key[-1])
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                fut.cancel()
+            else:
+                fut.set_exception(e)
+                fut.exception()  # retrieved here; waiters re-raise it themselves
+            raise
+        finally:
+            del self._inflight[chunk_key]
+        self._store(chunk_key, df)
+        fut.set_result(df)
+        return df
+
+    def clear(self) -> None:
+        self._frames.clear()  # fetches in flight still complete for their waiters
+        self._bytes = 0
+
+    def _store(self, key: tuple, df: pd.DataFrame) -> None:
+        size = int(df.memory_usage(index=True).sum())
+        if size > self._max_bytes:
+            return
+        self._frames[key] = df
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            _, old = self._frames.popitem(last=False)
+            self._bytes -= int(old.memory_usage(index=True).sum())
+
+
+def _slice(df: pd.DataFrame, start_ms: float, end_ms: float) -> pd.DataFrame:
+    import numpy as np
+    import pandas as pd
+
+    if df.empty:
+        return df
+    # DatetimeIndex (cloud) and int64 ns index (local) both compare as int64 ns
+    ns = df.index.asi8 if isinstance(df.index, pd.DatetimeIndex) else df.index.to_numpy()
+    lo = np.searchsorted(ns, int(start_ms * 1_000_000), side="left")
+    hi = np.searchsorted(ns, int(end_ms * 1_000_000), side="right")
+    return df.iloc[lo:hi]
@@ -0,0 +1,53 @@
+# tests/test_auth.py
+from gi_data.infra import auth
+
+
+class TestRpcClients:
+    def test_clients_are_shared_per_identity_only(self):
+        base = "http://rpc-clients.invalid"
+        try:
+            a = auth._rpc_client(base, "gibench", "alice", "pw", None)
+            assert auth._rpc_client(base, "gibench", "alice", "pw", None) is a
+            assert auth._rpc_client(base, "gibench", "bob", "pw", None) is not a
+            assert auth._rpc_client(base, "gibench", None, None, "token") is not a
+        finally:
+            auth._close_rpc_clients()
+        assert a.is_closed and not auth._RPC_CLIENTS
+
+
+def _manager(access_token=None):
+    m = auth.AuthManager("http://auth.invalid", access_token="static")
+    m._static = access_token is not None
+    m._login_needed = True
+    return m
+
+
+class TestTokenLifetime:
+    def test_token_expires_with_margin(self):
+        m = _manager()
+        m._store({"AccessToken": "t", "RefreshToken": "r", "ExpiresIn": 300})
+        left = (m._expires - auth.datetime.now(tz=auth.timezone.utc)).total_seconds()
+        assert 300 - auth._EXPIRY_MARGIN_S - 5 < left <= 300 - auth._EXPIRY_MARGIN_S
+        assert m.cached_token() == "t"
+
+    def test_short_lived_token_keeps_half_its_lifetime(self):
+        m = _manager()
+        m._store({"AccessToken": "t", "ExpiresIn": 20})
+        assert m.cached_token() == "t"
+
+    def test_invalidate_drops_rejected_token(self):
+        m = _manager()
+        m._store({"AccessToken": "t", "ExpiresIn": 300})
+        assert m.invalidate("t")
+        assert m.cached_token() is None
+
+    def test_invalidate_keeps_newer_token(self):
+        m = _manager()
+        m._store({"AccessToken": "new", "ExpiresIn": 300})
+        assert m.invalidate("old")
+        assert m.cached_token() == "new"
+
+    def test_static_token_cannot_be_renewed(self):
+        m = _manager(access_token="static")
+        assert not m.invalidate(m.cached_token())
+        assert m.cached_token() == "static"
@@ -0,0 +1,59 @@
+# tests/test_cloud_frames.py
+from uuid import UUID
+
+import numpy as np
+
+from gi_data.drivers.cloud_gql import _to_frame_from_raw
+
+A = UUID("00000000-0000-0000-0000-00000000000a")
+B = UUID("00000000-0000-0000-0000-00000000000b")
+
+
+def _rows(n):
+    # [ts_ms, nanos, a, b]
+    return [[1_000 + i, 0, float(i), float(10 * i)] for i in range(n)]
+
+
+class TestToFrameFromRaw:
+    def test_numeric_rows(self):
+        df = _to_frame_from_raw(_rows(4), [A, B])
+        assert list(df.columns) == [str(A), str(B)]
+        assert str(df.index.tz) == "UTC"
+        assert df.index[0].value == 1_000 * 1_000_000
+        np.testing.assert_array_equal(df[str(B)].to_numpy(), [0.0, 10.0, 20.0, 30.0])
+
+    def test_block_means(self):
+        df = _to_frame_from_raw(_rows(10), [A, B], points=5)
+        assert len(df) == 5
+        np.testing.assert_allclose(df[str(A)].to_numpy(), [0.5, 2.5, 4.5, 6.5, 8.5])
+        # every block starts at its first sample's timestamp
+        assert [t.value // 1_000_000 for t in df.index] == [1_000, 1_002, 1_004, 1_006, 1_008]
+
+    def test_gaps_only_blank_fully_missing_blocks(self):
+        rows = _rows(100)
+        rows[3][2] = None  # one gap in block 0
+        for r in rows[10:20]:
+            r[2] = None  # block 1 entirely missing
+        df = _to_frame_from_raw(rows, [A, B], points=10)
+        a = df[str(A)].to_numpy()
+        assert a[0] == np.mean([0, 1, 2, 4, 5, 6, 7, 8, 9])
+        assert np.isnan(a[1])
+        assert a[2] == 24.5
+        assert df[str(B)].notna().all()
+
+    def test_uneven_last_block(self):
+        df = _to_frame_from_raw(_rows(5), [A, B], points=2)  # blocks of 3 and 2
+        np.testing.assert_allclose(df[str(A)].to_numpy(), [1.0, 3.5])
+
+    def test_mixed_types_fall_back_per_column(self):
+        rows = [[1_000 + i, 0, float(i), f"s{i}"] for i in range(6)]
+        df = _to_frame_from_raw(rows, [A, B])
+        assert df[str(A)].dtype == np.float64
+        assert df[str(B)].dtype != np.float64  # object (str dtype on pandas >= 3)
+        assert list(df[str(B)]) == [f"s{i}" for i in range(6)]
+
+    def test_mixed_types_downsample_by_row_picking(self):
+        rows = [[1_000 + i, 0, float(i), f"s{i}"] for i in range(6)]
+        df = _to_frame_from_raw(rows, [A, B], points=3)
+        assert list(df[str(B)]) == ["s0", "s2", "s4"]
+        np.testing.assert_array_equal(df[str(A)].to_numpy(), [0.0, 2.0, 4.0])
@@ -0,0 +1,62 @@
+# tests/test_dataclient_wrappers.py
+import asyncio
+
+import pytest
+
+from gi_data.dataclient import GIDataClient
+from gi_data.mapping.enums import DataFormat
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # no connection: only the thin wrappers are exercised
+    c = object.__new__(GIDataClient)
+    calls = []
+    monkeypatch.setattr(c, "export_data", lambda *a, **kw: calls.append(("export", a, kw)) or b"x", raising=False)
+    monkeypatch.setattr(c, "import_data", lambda *a, **kw: calls.append(("import", a, kw)) or "sid", raising=False)
+    c.calls = calls
+    return c
+
+
+class TestExportImportWrappers:
+    @pytest.mark.parametrize("method,fmt", [("export_csv", DataFormat.CSV), ("export_udbf", DataFormat.UDBF)])
+    def test_export_wrappers(self, client, method, fmt):
+        assert getattr(client, method)(["sel"], start_ms=1, end_ms=2, points=3) == b"x"
+        assert client.calls == [("export", (["sel"],), dict(start_ms=1, end_ms=2, format=fmt, points=3))]
+
+    @pytest.mark.parametrize("method,fmt", [("import_csv", DataFormat.CSV), ("import_udbf", DataFormat.UDBF)])
+    def test_import_wrappers(self, client, method, fmt):
+        assert getattr(client, method)("sid", "name", b"data", target="t") == "sid"
+        assert client.calls == [("import", ("sid", "name", b"data"), dict(format=fmt, target="t"))]
+
+
+class _Closable:
+    def __init__(self, log, name, fail=False):
+        self.log, self.name, self.fail = log, name, fail
+
+    async def close(self):
+        self.log.append(self.name)
+        if self.fail:
+            raise ConnectionError("flush failed")
+
+    aclose = close
+
+
+class TestAclose:
+    def _client(self, log, ws_fail=False):
+        c = object.__new__(GIDataClient)
+        c._closed = False
+        c._ws_driver = _Closable(log, "ws", fail=ws_fail)
+        c._http = _Closable(log, "http")
+        return c
+
+    def test_ws_driver_is_closed_before_http(self):
+        log = []
+        asyncio.run(self._client(log).aclose())
+        assert log == ["ws", "http"]
+
+    def test_http_is_closed_when_ws_flush_fails(self):
+        log = []
+        with pytest.raises(ConnectionError):
+            asyncio.run(self._client(log, ws_fail=True).aclose())
+        assert log == ["ws", "http"]
@@ -0,0 +1,19 @@
+# tests/test_driver_factory.py
+from gi_data.dataclient import _driver_factory
+from gi_data.drivers.local_http import HTTPTimeSeriesDriver
+
+
+class _Driver:
+    def __init__(self, auth, http, client_id=None, domain="", extra=0):
+        self.args = (auth, http, client_id, domain, extra)
+
+
+class TestDriverFactory:
+    def test_default_driver_gets_its_root(self):
+        build = _driver_factory(HTTPTimeSeriesDriver, {}, object(), object())
+        assert build("buffer")._root == "buffer"
+        assert build("history")._root == "history"
+
+    def test_only_accepted_kwargs_are_passed(self):
+        build = _driver_factory(_Driver, {"extra": 5, "unknown": 1}, "auth", "http")
+        assert build("history").args == ("auth", "http", None, "history", 5)
@@ -0,0 +1,43 @@
+# tests/test_frames.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from gi_data.utils.frames import equidistant_index, frame_from_values
+
+
+class TestEquidistantIndex:
+    @pytest.mark.parametrize("utc", [False, True])
+    def test_axis_values(self, utc):
+        idx = equidistant_index(1_000, 10, 4, name="t", utc=utc)
+        ns = idx.asi8 if utc else idx.to_numpy()
+        assert ns.tolist() == [1_000, 1_010, 1_020, 1_030]
+        assert idx.name == "t"
+        if utc:
+            assert str(idx.tz) == "UTC"
+
+    @pytest.mark.parametrize("utc", [False, True])
+    def test_values_shared_but_index_objects_not(self, utc):
+        a = equidistant_index(0, 5, 8, name="t", utc=utc)
+        b = equidistant_index(0, 5, 8, name="t", utc=utc)
+        assert a is not b
+        assert np.shares_memory(a.asi8 if utc else a.to_numpy(), b.asi8 if utc else b.to_numpy())
+
+        df_a = frame_from_values([[1.0] * 8], ["x"], a)
+        df_b = frame_from_values([[2.0] * 8], ["x"], b)
+        df_a.index.name = "renamed"
+        assert df_b.index.name == "t"
+        assert b.name == "t"
+
+    def test_name_gives_separate_index(self):
+        a = equidistant_index(0, 1, 3, name="time")
+        b = equidistant_index(0, 1, 3, name="timestamp_ns")
+        assert (a.name, b.name) == ("time", "timestamp_ns")
+        assert a.equals(b)
+
+
+class TestFrameFromValues:
+    def test_none_becomes_nan(self):
+        idx = pd.Index([0, 1], name="t")
+        df = frame_from_values([[1.0, None], [3.0, 4.0]], ["a", "b"], idx)
+        assert np.isnan(df.loc[1, "a"]) and df.loc[1, "b"] == 4.0
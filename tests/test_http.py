@@ -0,0 +1,99 @@
+# tests/test_http.py
+import asyncio
+import io
+
+from gi_data.infra import http
+
+
+class TestIterFile:
+    def test_streams_file_from_current_position(self, monkeypatch):
+        monkeypatch.setattr(http, "UPLOAD_CHUNK", 4)
+        fh = io.BytesIO(b"xxabcdefghij")
+        fh.seek(2)
+
+        async def collect():
+            return [c async for c in http._iter_file(fh)]
+
+        assert asyncio.run(collect()) == [b"abcd", b"efgh", b"ij"]
+        assert http._remaining_size(fh) is None  # BytesIO has no fileno
+
+
+class _Auth:
+    def cached_token(self):
+        return "token"
+
+
+class TestJsonBody:
+    def test_numpy_scalars_are_serialised(self):
+        import httpx
+        import numpy as np
+        import orjson
+
+        seen = []
+
+        def handler(request):
+            seen.append(orjson.loads(request.content))
+            return httpx.Response(200, stream=httpx.ByteStream(b"{}"))
+
+        async def post():
+            client = http.AsyncHTTP("http://device.invalid", _Auth())
+            client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+            try:
+                return await client.post(
+                    "/online/data", json={"Variables": ["v"], "Values": [np.float64(1.5), np.int64(2)]}
+                )
+            finally:
+                await client._client.aclose()
+
+        assert asyncio.run(post()).status_code == 200
+        assert seen == [{"Variables": ["v"], "Values": [1.5, 2]}]
+
+
+class _RenewingAuth:
+    def __init__(self):
+        self.token = "old"
+
+    def cached_token(self):
+        return self.token
+
+    async def bearer(self):
+        self.token = "new"
+        return self.token
+
+    def invalidate(self, token):
+        self.token = None
+        return True
+
+
+class TestUnauthorizedRetry:
+    def _run(self, **post_kwargs):
+        import httpx
+
+        seen = []
+
+        def handler(request):
+            seen.append((request.headers["authorization"], request.content))
+            status = 200 if request.headers["authorization"] == "Bearer new" else 401
+            return httpx.Response(status, stream=httpx.ByteStream(b"{}"))
+
+        async def post():
+            client = http.AsyncHTTP("http://device.invalid", _RenewingAuth())
+            client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+            try:
+                return await client.post("/rpc", **post_kwargs)
+            finally:
+                await client._client.aclose()
+
+        return asyncio.run(post()), seen
+
+    def test_request_is_repeated_once_with_a_fresh_token(self):
+        res, seen = self._run(json={"a": 1})
+        assert res.status_code == 200
+        assert seen == [("Bearer old", b'{"a":1}'), ("Bearer new", b'{"a":1}')]
+
+    def test_streamed_file_is_not_repeated(self):
+        import httpx
+        import pytest
+
+        with pytest.raises(httpx.HTTPStatusError):
+            self._run(content=io.BytesIO(b"payload"))
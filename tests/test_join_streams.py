@@ -0,0 +1,67 @@
+# tests/test_join_streams.py
+import numpy as np
+import pandas as pd
+
+from gi_data.drivers.cloud_gql import _join_streams
+
+
+def _frame(start_ms, step_ms, n, col, offset=0.0):
+    ts = (np.arange(n, dtype=np.int64) * step_ms + start_ms) * 1_000_000
+    idx = pd.DatetimeIndex(ts.view("M8[ns]"), tz="UTC", name="time")
+    return pd.DataFrame({col: np.arange(n, dtype=np.float64) + offset}, index=idx)
+
+
+class TestJoinStreams:
+    def test_single_frame_is_returned_as_is(self):
+        df = _frame(0, 10, 5, "a")
+        assert _join_streams([df]) is df
+
+    def test_identical_index_concatenates(self):
+        a = _frame(0, 10, 5, "a")
+        b = pd.DataFrame({"b": np.ones(5)}, index=a.index)
+        out = _join_streams([a, b])
+        assert list(out.columns) == ["a", "b"]
+        assert out.index.equals(a.index)
+
+    def test_different_rates_keep_every_sample(self):
+        fast = _frame(0, 10, 100, "fast")   # 100 Hz
+        slow = _frame(0, 100, 10, "slow")   # 10 Hz
+        out = _join_streams([slow, fast])
+        assert list(out.columns) == ["slow", "fast"]
+        assert out.index.is_monotonic_increasing
+        # no fabricated repeats: each slow sample appears exactly once
+        assert out["slow"].notna().sum() == 10
+        assert out["fast"].notna().sum() == 100
+        assert len(out) == 100
+
+    def test_disjoint_ranges_are_outer_joined(self):
+        a = _frame(0, 10, 10, "a")
+        b = _frame(1_000, 10, 5, "b")
+        out = _join_streams([a, b])
+        assert len(out) == 15
+        assert out["a"].notna().sum() == 10
+        assert out["b"].notna().sum() == 5
+
+    def test_same_grid_with_offset_is_aligned(self):
+        a = _frame(0, 10, 10, "a")
+        b = _frame(2, 10, 10, "b")  # same spacing, shifted by 2 ms
+        out = _join_streams([a, b])
+        assert len(out) == 10
+        assert out.index.equals(a.index)
+        np.testing.assert_array_equal(out["b"].to_numpy(), np.arange(10, dtype=np.float64))
+
+    def test_half_spacing_offset_keeps_every_sample(self):
+        a = _frame(0, 10, 999, "a")
+        b = _frame(5, 10, 999, "b")  # same grid, shifted by half a spacing
+        out = _join_streams([a, b])
+        assert out["a"].notna().sum() == 999
+        assert out["b"].notna().sum() == 999
+
+    def test_spacing_drift_keeps_every_sample(self):
+        a = _frame(0, 10, 990, "a")
+        ts = (np.arange(990) * 9.91 * 1_000_000).astype(np.int64)  # 0.9 % faster clock
+        idx = pd.DatetimeIndex(ts.view("M8[ns]"), tz="UTC", name="time")
+        b = pd.DataFrame({"b": np.arange(990, dtype=np.float64)}, index=idx)
+        out = _join_streams([a, b])
+        assert out["a"].notna().sum() == 990
+        assert out["b"].notna().sum() == 990
@@ -0,0 +1,60 @@
+# tests/test_models.py
+from uuid import UUID
+
+import pytest
+
+from gi_data.mapping import models
+from gi_data.mapping.models import BufferSuccess, GIStreamVariable, model_from_raw, unique_selectors, var_selector
+
+VID = UUID("00000000-0000-0000-0000-000000000001")
+
+TS = {
+    "Type": "equidistant", "Format": "json", "Unit": "", "Start": 0.0, "AbsoluteStart": 0.0,
+    "Delta": 1.0, "End": 1.0, "Size": 2, "MeasurementId": "m", "Values": [[1.0, None]],
+}
+
+RAW_VAR = {"Id": "v", "Name": "n", "Index": 0, "Unit": "V", "DataFormat": "Double", "sid": "s"}
+
+
+class TestUniqueSelectors:
+    def test_drops_repeats_keeping_order(self):
+        a = var_selector("s1", VID)
+        b = var_selector("s2", VID)
+        # same VID as str/upper-case str counts as a repeat
+        c = var_selector("s1", str(VID).upper())
+        assert unique_selectors([a, b, c, a]) == (a, b)
+
+    def test_selector_distinguishes(self):
+        a = var_selector("s1", VID)
+        m = var_selector("s1", VID, "measurement-1")
+        assert unique_selectors([a, m]) == (a, m)
+
+
+class TestBufferSuccessUnwrap:
+    def test_single_item(self):
+        res = BufferSuccess.model_validate({"Success": True, "Data": {"TimeSeries": TS}})
+        assert len(res.Data) == 1
+        assert res.first_timeseries().Values == [[1.0, None]]
+
+    def test_item_list(self):
+        res = BufferSuccess.model_validate({"Success": True, "Data": [{"TimeSeries": TS}, {"TimeSeries": TS}]})
+        assert len(res.Data) == 2
+
+    def test_input_is_not_mutated(self):
+        body = {"Success": True, "Data": {"TimeSeries": TS}}
+        BufferSuccess.model_validate(body)
+        assert body["Data"] == {"TimeSeries": TS}
+
+
+class TestModelFromRaw:
+    def test_validates_by_default(self):
+        v = model_from_raw(GIStreamVariable, dict(RAW_VAR, Index="3"))
+        assert v.index == 3
+        with pytest.raises(Exception):
+            model_from_raw(GIStreamVariable, {k: x for k, x in RAW_VAR.items() if k != "Unit"})
+
+    def test_trusted_checks_required_keys(self, monkeypatch):
+        monkeypatch.setattr(models, "TRUST_RESPONSES", True)
+        assert model_from_raw(GIStreamVariable, RAW_VAR).unit == "V"
+        with pytest.raises(ValueError, match="DataFormat"):
+            model_from_raw(GIStreamVariable, {k: x for k, x in RAW_VAR.items() if k != "DataFormat"})
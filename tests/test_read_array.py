@@ -0,0 +1,29 @@
+# tests/test_read_array.py
+import asyncio
+
+import numpy as np
+
+from gi_data.drivers.base import BaseDriver
+
+
+class _Driver(BaseDriver):
+    def __init__(self, values):
+        self.values = values
+        self.asked = None
+
+    async def read_values(self, var_ids):
+        self.asked = var_ids
+        return self.values
+
+
+class TestReadArray:
+    def test_values_in_request_order(self):
+        drv = _Driver([1.0, None, 3.0])
+        out = asyncio.run(drv.read_array(["a", "b", "c"]))
+        assert drv.asked == ["a", "b", "c"]
+        assert out.dtype == np.float64
+        np.testing.assert_array_equal(out, [1.0, np.nan, 3.0])
+
+    def test_missing_data_is_padded_with_nan(self):
+        out = asyncio.run(_Driver([]).read_array(["a", "b"]))
+        assert out.shape == (2,) and np.isnan(out).all()
@@ -0,0 +1,30 @@
+# tests/test_uuids.py
+from uuid import UUID, uuid4
+
+import numpy as np
+
+from gi_data.utils.uuids import uuid_array, uuid_key, uuid_str, uuid_strings
+
+
+class TestUuids:
+    def test_uuid_strings_roundtrip(self):
+        ids = [uuid4() for _ in range(5)]
+        assert uuid_strings(uuid_array(ids)) == [str(u) for u in ids]
+
+    def test_uuid_strings_empty(self):
+        assert uuid_strings(np.empty((0, 16), dtype=np.uint8)) == []
+
+    def test_uuid_key_canonicalises(self):
+        u = UUID("0190a1b2-c3d4-7e5f-8a9b-0c1d2e3f4a5b")
+        assert uuid_key(u) == str(u)
+        assert uuid_key(str(u).upper()) == str(u)
+        assert uuid_key(u.hex) == str(u)
+
+    def test_uuid_key_passes_other_ids_through(self):
+        assert uuid_key("not-a-uuid") == "not-a-uuid"
+        assert uuid_key(42) == "42"
+
+    def test_uuid_str(self):
+        u = uuid4()
+        assert uuid_str(u) == str(u)
+        assert uuid_str("abc") == "abc"
@@ -0,0 +1,36 @@
+# tests/test_var_mapping_cache.py
+import orjson
+
+from gi_data.mapping import cache
+
+
+class TestVarMappingCache:
+    def test_saves_merge_per_stream(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GI_CACHE_DIR", str(tmp_path))
+        cache.save_var_mapping("https://t.example", {"s1": {"v1": "f1"}}, ["s1"])
+        # a second driver / process with its own in-memory mapping
+        cache.save_var_mapping("https://t.example", {"s2": {"v2": "f2"}}, ["s2"])
+        assert cache.load_var_mapping("https://t.example") == {"s1": {"v1": "f1"}, "s2": {"v2": "f2"}}
+
+    def test_refresh_replaces_stream_entry(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GI_CACHE_DIR", str(tmp_path))
+        cache.save_var_mapping("https://t.example", {"s1": {"v1": "old", "v2": "f2"}})
+        cache.save_var_mapping("https://t.example", {"s1": {"v1": "new"}}, ["s1"])
+        assert cache.load_var_mapping("https://t.example") == {"s1": {"v1": "new"}}
+
+    def test_expired_and_legacy_entries_are_dropped(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GI_CACHE_DIR", str(tmp_path))
+        cache.save_var_mapping("https://t.example", {"s1": {"v1": "f1"}})
+        monkeypatch.setattr(cache, "MAPPING_TTL_S", -1.0)
+        assert cache.load_var_mapping("https://t.example") == {}
+
+        path = cache._cache_file("https://t.example")
+        path.write_bytes(orjson.dumps({"s1": {"v1": "f1"}}))  # pre-expiry file layout
+        monkeypatch.setattr(cache, "MAPPING_TTL_S", 3600.0)
+        assert cache.load_var_mapping("https://t.example") == {}
+
+    def test_no_temp_files_left_behind(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("GI_CACHE_DIR", str(tmp_path))
+        for i in range(3):
+            cache.save_var_mapping("https://t.example", {f"s{i}": {"v": "f"}}, [f"s{i}"])
+        assert [p.name for p in tmp_path.iterdir()] == ["t.example.vm.json"]
@@ -0,0 +1,111 @@
+# tests/test_window_cache.py
+import asyncio
+
+import numpy as np
+import pandas as pd
+
+from gi_data.utils.window_cache import WindowCache
+
+T0 = 1_600_000_000_000  # absolute window in the past (epoch ms)
+
+
+class _Backend:
+    """Fake ``fetch_buffer``: one sample per ms, counts its calls."""
+
+    def __init__(self, delay_s=0.0):
+        self.calls = []
+        self.delay_s = delay_s
+
+    async def fetch(self, *, start_ms, end_ms, points):
+        self.calls.append((start_ms, end_ms, points))
+        if self.delay_s:
+            await asyncio.sleep(self.delay_s)
+        ts = np.arange(int(start_ms), int(end_ms) + 1, dtype=np.int64)
+        idx = pd.DatetimeIndex((ts * 1_000_000).view("M8[ns]"), tz="UTC", name="time")
+        return pd.DataFrame({"v": ts.astype(np.float64)}, index=idx)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestWindowCache:
+    def test_cacheable(self):
+        assert WindowCache.cacheable(T0, T0 + 1)
+        assert not WindowCache.cacheable(-20_000, 0)  # relative window
+        assert not WindowCache.cacheable(T0, T0)
+
+    def test_chunk_is_aligned_and_covers_the_window(self):
+        backend, cache = _Backend(), WindowCache()
+        df = _run(cache.fetch(("k",), backend.fetch, start_ms=T0 + 100, end_ms=T0 + 1_100, points=1_000))
+        (lo, hi, points), = backend.calls
+        chunk = hi - lo
+        assert chunk == 2048  # next power of two >= 2 * span
+        assert lo % (chunk // 2) == 0 and lo <= T0 + 100 and T0 + 1_100 <= hi
+        assert points == int(np.ceil(1_000 * chunk / 1_000))  # same density as requested
+        assert df["v"].iloc[0] == T0 + 100 and df["v"].iloc[-1] == T0 + 1_100
+
+    def test_scrolling_window_is_served_from_memory(self):
+        backend, cache = _Backend(), WindowCache()
+
+        async def scroll():
+            for shift in range(0, 500, 50):
+                await cache.fetch(("k",), backend.fetch, start_ms=T0 + shift, end_ms=T0 + shift + 1_000, points=10)
+
+        _run(scroll())
+        assert len(backend.calls) <= 2  # chunks overlap by half
+
+    def test_results_are_copies(self):
+        backend, cache = _Backend(), WindowCache()
+
+        async def twice():
+            a = await cache.fetch(("k",), backend.fetch, start_ms=T0, end_ms=T0 + 100, points=10)
+            a.iloc[0, 0] = -1.0
+            a["v"] = a["v"].fillna(0)
+            return await cache.fetch(("k",), backend.fetch, start_ms=T0, end_ms=T0 + 100, points=10)
+
+        b = _run(twice())
+        assert b["v"].iloc[0] == T0
+        assert len(backend.calls) == 1
+
+    def test_concurrent_misses_share_one_fetch(self):
+        backend, cache = _Backend(delay_s=0.01), WindowCache()
+
+        async def burst():
+            return await asyncio.gather(*(
+                cache.fetch(("k",), backend.fetch, start_ms=T0, end_ms=T0 + 100, points=10) for _ in range(5)
+            ))
+
+        frames = _run(burst())
+        assert len(backend.calls) == 1
+        assert all(f.equals(frames[0]) for f in frames)
+
+    def test_failed_fetch_reaches_all_waiters_and_is_not_cached(self):
+        cache = WindowCache()
+        calls = []
+
+        async def failing(**kw):
+            calls.append(kw)
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        async def burst():
+            return await asyncio.gather(*(
+                cache.fetch(("k",), failing, start_ms=T0, end_ms=T0 + 100, points=10) for _ in range(3)
+            ), return_exceptions=True)
+
+        results = _run(burst())
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert len(calls) == 1
+        assert not cache._inflight and not cache._frames
+
+    def test_chunks_reaching_into_the_future_are_not_cached(self):
+        backend, cache = _Backend(), WindowCache()
+        now = int(pd.Timestamp.now(tz="UTC").value // 1_000_000)
+
+        async def twice():
+            for _ in range(2):
+                await cache.fetch(("k",), backend.fetch, start_ms=now - 100, end_ms=now - 1, points=10)
+
+        _run(twice())
+        assert backend.calls == [(now - 100, now - 1, 10)] * 2
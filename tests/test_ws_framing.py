@@ -0,0 +1,29 @@
+# tests/test_ws_framing.py
+import asyncio
+
+import numpy as np
+import orjson
+
+from gi_data.infra.ws import AsyncWS
+
+
+class _Socket:
+    def __init__(self):
+        self.frames = []
+
+    async def send(self, frame):
+        self.frames.append(frame)
+
+
+class TestSendFrame:
+    def test_frame_layout_with_numpy_values(self):
+        ws = AsyncWS("http://device.invalid", None)
+        ws._ws = _Socket()
+        header = ["", 1, 2, 1, ""]
+        asyncio.run(ws.send(header, {"Variables": ["v"], "Values": [np.float64(1.5), np.int32(2)]}))
+
+        frame, = ws._ws.frames
+        size = int.from_bytes(frame[1:3], "little")
+        assert frame[:1] == AsyncWS.VERSION_BYTE
+        assert orjson.loads(frame[3:3 + size]) == header
+        assert orjson.loads(frame[3 + size:]) == {"Variables": ["v"], "Values": [1.5, 2]}
@@ -0,0 +1,93 @@
+# tests/test_ws_publish_batch.py
+import asyncio
+
+import pytest
+
+from gi_data.drivers.ws_stream import WebSocketDriver
+
+
+class _FakeWS:
+    def __init__(self):
+        self.sent = []
+        self.fail = False
+        self.closed = False
+
+    async def send(self, header, payload):
+        if self.fail:
+            raise ConnectionError("socket closed")
+        self.sent.append(payload)
+
+    async def close(self):
+        self.closed = True
+
+
+def _driver():
+    ws = _FakeWS()
+    return WebSocketDriver(None, ws, None), ws
+
+
+class TestPublishBatch:
+    def test_values_are_coalesced_into_one_frame(self):
+        drv, ws = _driver()
+
+        async def run():
+            await drv.publish_batch({"a": 1.0})
+            await drv.publish_batch({"b": 2.0, "a": 3.0})
+            await drv.flush()
+
+        asyncio.run(run())
+        assert ws.sent == [{"Variables": ["a", "b"], "Values": [3.0, 2.0], "Function": "write"}]
+
+    def test_failed_background_flush_is_raised_and_values_requeued(self):
+        drv, ws = _driver()
+
+        async def run():
+            ws.fail = True
+            await drv.publish_batch({"a": 1.0}, flush_ms=0)
+            await asyncio.sleep(0.01)  # background flush fails
+            ws.fail = False
+            with pytest.raises(ConnectionError):
+                await drv.publish_batch({"b": 2.0})
+            await drv.publish_batch({"a": 4.0})
+            await drv.flush()
+
+        asyncio.run(run())
+        assert ws.sent == [{"Variables": ["a", "b"], "Values": [4.0, 2.0], "Function": "write"}]
+
+    def test_flush_reraises_and_keeps_unsent_values(self):
+        drv, ws = _driver()
+
+        async def run():
+            await drv.publish_batch({"a": 1.0}, function="write")
+            await drv.publish_batch({"b": 2.0}, function="set")
+            ws.fail = True
+            with pytest.raises(ConnectionError):
+                await drv.flush()
+            ws.fail = False
+            await drv.flush()
+
+        asyncio.run(run())
+        assert [p["Function"] for p in ws.sent] == ["write", "set"]
+
+    def test_close_sends_pending_values_then_closes(self):
+        drv, ws = _driver()
+
+        async def run():
+            await drv.publish_batch({"a": 1.0}, flush_ms=20)
+            await drv.close()
+
+        asyncio.run(run())
+        assert ws.sent == [{"Variables": ["a"], "Values": [1.0], "Function": "write"}]
+        assert ws.closed
+
+    def test_close_closes_socket_when_flush_fails(self):
+        drv, ws = _driver()
+
+        async def run():
+            await drv.publish_batch({"a": 1.0}, flush_ms=20)
+            ws.fail = True
+            with pytest.raises(ConnectionError):
+                await drv.close()
+
+        asyncio.run(run())
+        assert ws.closed